@@ -6,6 +6,7 @@ Implements knowledge base with CNF-encoded rules and inference methods.
 
 from typing import Dict, List, Set, Tuple, Optional
 from dataclasses import dataclass
+from functools import lru_cache
 
 # Ordered list of 169 hands (rank 1 = best), matching POKER_HAND_WIN_PERCENTAGES.md.
 HAND_RANK_LIST = [
@@ -26,10 +27,17 @@ HAND_STRENGTH_MARGINAL_MAX = 116
 STACK_SIZE_ULTRA_SHORT_MAX = 10
 STACK_SIZE_SHORT_MAX = 20
 
+# Representative stack (BB) for each stack bucket: ultra-short, short, adequate.
+_BUCKET_STACKS = (5, 15, 50)
+POSITIONS = ("Button", "Big Blind")
+OPPONENT_TENDENCIES = ("Tight", "Loose", "Aggressive", "Passive", "Unknown")
+
 
 @dataclass
 class CNFRule:
     """Represents a propositional logic rule in CNF (Conjunctive Normal Form)."""
+    __slots__ = ("name", "cnf", "clauses", "description")
+
     name: str
     cnf: str  # CNF formula as string
     clauses: List[List[str]]  # List of clauses, each clause is list of literals
@@ -38,11 +46,15 @@ class CNFRule:
 
 class KnowledgeBase:
     """Knowledge base for propositional logic rules in CNF format."""
-    
+
+    __slots__ = ("rules", "facts", "inference_chain", "_conclusion_index", "_conclusion_index_size")
+
     def __init__(self):
         self.rules: List[CNFRule] = []
         self.facts: Dict[str, bool] = {}
         self.inference_chain: List[str] = []
+        self._conclusion_index: Dict[str, List[CNFRule]] = {}
+        self._conclusion_index_size = -1
     
     def add_rule(self, rule: CNFRule):
         """Add a rule to the knowledge base."""
@@ -64,7 +76,28 @@ class KnowledgeBase:
         return self._backward_chain(goal, set())
     
     def _backward_chain(self, goal: str, visited: Set[str]) -> Tuple[bool, List[str]]:
-        """Backward chaining: work backwards from goal to facts."""
+        """
+        Backward chaining: work backwards from goal to facts.
+
+        Runs iteratively: each (sub-)goal is a ``_prove`` generator on an explicit
+        stack that yields the sub-goals it needs and receives their results.
+        """
+        stack = [self._prove(goal, visited)]
+        result: Optional[Tuple[bool, List[str]]] = None
+        while True:
+            try:
+                sub_goal, sub_visited = stack[-1].send(result)
+            except StopIteration as done:
+                stack.pop()
+                result = done.value
+                if not stack:
+                    return result
+                continue
+            result = None
+            stack.append(self._prove(sub_goal, sub_visited))
+    
+    def _prove(self, goal: str, visited: Set[str]):
+        """Prove one goal; yields ``(sub_goal, visited)`` and is sent ``(result, chain)``."""
         if goal in self.facts:
             return self.facts[goal], [f"Goal '{goal}' is a known fact: {self.facts[goal]}"]
         
@@ -75,75 +108,76 @@ class KnowledgeBase:
         chain = [f"Attempting to prove '{goal}'"]
         
         # Find rules that can derive this goal
-        for rule in self.rules:
-            if goal in self._get_conclusions(rule):
-                # For CNF rules, we need to check if we can conclude the goal
-                # A clause like (¬A ∨ ¬B ∨ C) means IF (A ∧ B) THEN C
-                # To conclude C, we need A=True AND B=True
-                premises_satisfied = True
-                premise_chain = []
+        for rule in self._rules_concluding(goal):
+            # For CNF rules, we need to check if we can conclude the goal
+            # A clause like (¬A ∨ ¬B ∨ C) means IF (A ∧ B) THEN C
+            # To conclude C, we need A=True AND B=True
+            premises_satisfied = True
+            premise_chain = []
+            
+            for clause in rule.clauses:
+                if goal not in clause:
+                    continue  # Skip clauses that don't contain the goal
                 
-                for clause in rule.clauses:
-                    if goal not in clause:
-                        continue  # Skip clauses that don't contain the goal
-                    
-                    # Check if all premises (non-goal literals) are satisfied
-                    # For (¬A ∨ ¬B ∨ C), to conclude C, we need A=True and B=True
-                    all_premises_satisfied = True
-                    clause_premise_chain = []
+                # Check if all premises (non-goal literals) are satisfied
+                # For (¬A ∨ ¬B ∨ C), to conclude C, we need A=True and B=True
+                all_premises_satisfied = True
+                clause_premise_chain = []
+                
+                for literal in clause:
+                    if literal == goal:
+                        continue  # Skip the conclusion itself
                     
-                    for literal in clause:
-                        if literal == goal:
-                            continue  # Skip the conclusion itself
-                        
-                        premise_satisfied = False
-                        if literal.startswith("¬"):
-                            # Negated premise like ¬A in (¬A ∨ ¬B ∨ C)
-                            # To conclude C, we need A to be True (so ¬A is False, forcing C)
-                            fact = literal[1:]
-                            if fact in self.facts:
-                                if self.facts[fact]:  # Fact is True, so negation is False
-                                    premise_satisfied = True
-                                    clause_premise_chain.append(f"Fact '{fact}' is True → '{literal}' is False (forces conclusion)")
+                    # Negated premise ¬A in (¬A ∨ ¬B ∨ C): A must be True (so ¬A is False,
+                    # forcing C). Positive premise: the fact itself must be True.
+                    negated = literal.startswith("¬")
+                    fact = literal[1:] if negated else literal
+                    premise_satisfied = False
+                    if fact in self.facts:
+                        if self.facts[fact]:
+                            premise_satisfied = True
+                            if negated:
+                                clause_premise_chain.append(f"Fact '{fact}' is True → '{literal}' is False (forces conclusion)")
                             else:
-                                # Try to prove the fact
-                                result, sub_chain = self._backward_chain(fact, visited.copy())
-                                if result:  # Fact is True, so negation is False
-                                    premise_satisfied = True
-                                    clause_premise_chain.extend(sub_chain)
-                        else:
-                            # Positive premise: fact must be True
-                            if literal in self.facts:
-                                if self.facts[literal]:
-                                    premise_satisfied = True
-                                    clause_premise_chain.append(f"Fact '{literal}' is True")
-                            else:
-                                # Try to prove the fact
-                                result, sub_chain = self._backward_chain(literal, visited.copy())
-                                if result:
-                                    premise_satisfied = True
-                                    clause_premise_chain.extend(sub_chain)
-                        
-                        if not premise_satisfied:
-                            all_premises_satisfied = False
-                            break
+                                clause_premise_chain.append(f"Fact '{literal}' is True")
+                    else:
+                        # Try to prove the fact
+                        result, sub_chain = yield fact, visited.copy()
+                        if result:
+                            premise_satisfied = True
+                            clause_premise_chain.extend(sub_chain)
                     
-                    if all_premises_satisfied:
-                        # This clause allows us to conclude the goal
-                        premise_chain.extend(clause_premise_chain)
-                        premises_satisfied = True
+                    if not premise_satisfied:
+                        all_premises_satisfied = False
                         break
-                    else:
-                        premises_satisfied = False
                 
-                if premises_satisfied:
-                    self.facts[goal] = True
-                    chain.extend(premise_chain)
-                    chain.append(f"Proved '{goal}' using {rule.name}")
-                    return True, chain
+                if all_premises_satisfied:
+                    # This clause allows us to conclude the goal
+                    premise_chain.extend(clause_premise_chain)
+                    premises_satisfied = True
+                    break
+                else:
+                    premises_satisfied = False
+            
+            if premises_satisfied:
+                self.facts[goal] = True
+                chain.extend(premise_chain)
+                chain.append(f"Proved '{goal}' using {rule.name}")
+                return True, chain
         
         return False, chain + [f"Cannot prove '{goal}'"]
     
+    def _rules_concluding(self, goal: str) -> List[CNFRule]:
+        """Rules that can derive ``goal``, indexed once per rule set."""
+        if self._conclusion_index_size != len(self.rules):
+            index: Dict[str, List[CNFRule]] = {}
+            for rule in self.rules:
+                for conclusion in self._get_conclusions(rule):
+                    index.setdefault(conclusion, []).append(rule)
+            self._conclusion_index = index
+            self._conclusion_index_size = len(self.rules)
+        return self._conclusion_index.get(goal, [])
+    
     def _get_conclusions(self, rule: CNFRule) -> List[str]:
         """Extract all conclusions from a rule."""
         conclusions = []
@@ -157,15 +191,15 @@ class KnowledgeBase:
     
     def to_dict(self) -> Dict:
         """Convert knowledge base to dictionary for output."""
+        if len(self.rules) == len(_CNF_RULES) and all(
+            a is b for a, b in zip(self.rules, _CNF_RULES)
+        ):
+            # Standard rule set: reuse the serialization built at import.
+            rules = [dict(d) for d in _CNF_RULES_DICTS]
+        else:
+            rules = [_rule_to_dict(rule) for rule in self.rules]
         return {
-            "rules": [
-                {
-                    "name": rule.name,
-                    "cnf": rule.cnf,
-                    "description": rule.description
-                }
-                for rule in self.rules
-            ],
+            "rules": rules,
             "facts": self.facts.copy(),
             "inference_chain": self.inference_chain.copy()
         }
@@ -184,10 +218,13 @@ def _rank_to_tier(rank: int) -> str:
     return "Weak"
 
 
-def _normalize_hand(hand: str) -> Optional[str]:
-    """Return standard hand notation (as in HAND_RANK_LIST) or None if unknown."""
+_HAND_SET = frozenset(HAND_RANK_LIST)
+
+
+def _normalize_hand_slow(hand: str) -> Optional[str]:
+    """Alias/suffix matcher behind ``_normalize_hand`` (used to build its table)."""
     h = hand.strip()
-    if h in HAND_RANK_LIST:
+    if h in _HAND_SET:
         return h
     # Map common input "AKs"/"AKo" to list form "KAs"/"KAo" (document uses high card first)
     key = h.replace("-", " ").replace("  ", " ").lower()
@@ -206,31 +243,72 @@ def _normalize_hand(hand: str) -> Optional[str]:
         two = (h[0] + h[1]).upper()
         rest = h[2:].strip().lower()
         # Check if exact match exists
-        if two + "s" in HAND_RANK_LIST and rest in ("s", "suit", "suited", ""):
+        if two + "s" in _HAND_SET and rest in ("s", "suit", "suited", ""):
             return two + "s"
-        if two + "o" in HAND_RANK_LIST and rest in ("o", "off", "offsuit", ""):
+        if two + "o" in _HAND_SET and rest in ("o", "off", "offsuit", ""):
             return two + "o"
-        if two in HAND_RANK_LIST and (rest == "" or "pair" in rest):
+        if two in _HAND_SET and (rest == "" or "pair" in rest):
             return two
         # Try reversed (for cases like "AKs" -> "KAs")
         if len(two) == 2:
             reversed_two = two[1] + two[0]
-            if reversed_two + "s" in HAND_RANK_LIST and rest in ("s", "suit", "suited", ""):
+            if reversed_two + "s" in _HAND_SET and rest in ("s", "suit", "suited", ""):
                 return reversed_two + "s"
-            if reversed_two + "o" in HAND_RANK_LIST and rest in ("o", "off", "offsuit", ""):
+            if reversed_two + "o" in _HAND_SET and rest in ("o", "off", "offsuit", ""):
                 return reversed_two + "o"
     return None
 
 
+def _build_normalize_table() -> Dict[str, str]:
+    """Precompute common spellings (either rank order, any case, s/o suffix) and aliases."""
+    candidates = {"ace king suited", "ace king offsuit", "pocket aces", "aces", "kings", "queens"}
+    for hand in HAND_RANK_LIST:
+        for two in (hand[:2], hand[1::-1]):
+            for ranks in (two, two.lower()):
+                for suffix in ("", "s", "o", "S", "O"):
+                    candidates.add(ranks + suffix)
+    table: Dict[str, str] = {}
+    for spelling in candidates:
+        norm = _normalize_hand_slow(spelling)
+        if norm is not None:
+            table[spelling] = norm
+    return table
+
+
+_NORMALIZE_TABLE: Dict[str, str] = _build_normalize_table()
+_HAND_RANK_INDEX: Dict[str, int] = {h: i + 1 for i, h in enumerate(HAND_RANK_LIST)}
+
+_RANK_CHARS = "23456789TJQKA"
+
+
+def encode_hand(hand: str) -> int:
+    """
+    Pack a hand in HAND_RANK_LIST notation into 16 bits:
+    first rank << 8 | second rank << 4 | suit flag (0 pair, 1 suited, 2 offsuit).
+    """
+    suit_flag = {"s": 1, "o": 2}.get(hand[2:], 0)
+    return _RANK_CHARS.index(hand[0]) << 8 | _RANK_CHARS.index(hand[1]) << 4 | suit_flag
+
+
+HAND_IDS: Dict[str, int] = {h: encode_hand(h) for h in HAND_RANK_LIST}
+ID_TO_HAND: Dict[int, str] = {i: h for h, i in HAND_IDS.items()}
+
+
+def _normalize_hand(hand: str) -> Optional[str]:
+    """Return standard hand notation (as in HAND_RANK_LIST) or None if unknown."""
+    h = hand.strip()
+    norm = _NORMALIZE_TABLE.get(h)
+    if norm is not None:
+        return norm
+    return _normalize_hand_slow(h)
+
+
 def _get_hand_rank(hand: str) -> Optional[int]:
     """Return 1-based rank (1 = best) or None if unknown."""
     norm = _normalize_hand(hand)
     if norm is None:
         return None
-    try:
-        return HAND_RANK_LIST.index(norm) + 1
-    except ValueError:
-        return None
+    return _HAND_RANK_INDEX.get(norm)
 
 
 def _create_cnf_rules() -> List[CNFRule]:
@@ -344,6 +422,19 @@ def _create_cnf_rules() -> List[CNFRule]:
     return rules
 
 
+def _rule_to_dict(rule: CNFRule) -> Dict[str, str]:
+    return {
+        "name": rule.name,
+        "cnf": rule.cnf,
+        "description": rule.description
+    }
+
+
+# The rule set never changes, so build it (and its output form) once.
+_CNF_RULES: Tuple[CNFRule, ...] = tuple(_create_cnf_rules())
+_CNF_RULES_DICTS: Tuple[Dict[str, str], ...] = tuple(_rule_to_dict(r) for r in _CNF_RULES)
+
+
 def _derive_facts_from_input(
     hand: str,
     position: str,
@@ -526,7 +617,7 @@ def propositional_logic_hand_decider(
     kb = KnowledgeBase()
     
     # Add CNF rules
-    for rule in _create_cnf_rules():
+    for rule in _CNF_RULES:
         kb.add_rule(rule)
     
     # Derive facts from input (including whether we are facing a bet)
@@ -607,3 +698,56 @@ def propositional_logic_hand_decider(
         "knowledge_base": kb.to_dict(),
         "inference_chain": kb.inference_chain,
     }
+
+
+def _stack_bucket(stack_size: int) -> int:
+    """Map a stack (BB) to the bucket index used by Rules 7-9."""
+    if stack_size < STACK_SIZE_ULTRA_SHORT_MAX:
+        return 0
+    if stack_size < STACK_SIZE_SHORT_MAX:
+        return 1
+    return 2
+
+
+@lru_cache(maxsize=None)
+def _playable_for_bucket(hand_id: int, position: str, bucket: int, opponent_tendency: str) -> bool:
+    return propositional_logic_hand_decider(
+        ID_TO_HAND[hand_id], position, _BUCKET_STACKS[bucket], opponent_tendency
+    )["playable"]
+
+
+def is_hand_playable(
+    hand: str,
+    position: str,
+    stack_size: int,
+    opponent_tendency: str,
+) -> bool:
+    """
+    Memoized playability only (no knowledge base or inference chain).
+
+    The verdict depends on the hand, position, stack bucket, and tendency only,
+    so each combination runs the full decider once; use this on hot paths
+    (bots) that just need the boolean.
+    """
+    norm = _normalize_hand(hand)
+    if norm is None:
+        # Unknown spellings are rare; decide them directly instead of caching.
+        return propositional_logic_hand_decider(
+            hand, position, stack_size, opponent_tendency
+        )["playable"]
+    return _playable_for_bucket(
+        HAND_IDS[norm],
+        position.strip().lower().replace("_", " "),
+        _stack_bucket(stack_size),
+        opponent_tendency.strip().lower(),
+    )
+
+
+def precompute_playability() -> int:
+    """Fill the playability memo for every (hand, position, stack bucket, tendency)."""
+    for hand in HAND_RANK_LIST:
+        for position in POSITIONS:
+            for stack in _BUCKET_STACKS:
+                for tendency in OPPONENT_TENDENCIES:
+                    is_hand_playable(hand, position, stack, tendency)
+    return _playable_for_bucket.cache_info().currsize
@@ -148,6 +148,21 @@ def get_bet_sizes_for_scenario(
     return sorted(list(set(candidates)))
 
 
+def to_centi_bb(size: float) -> int:
+    """
+    Convert a bet size in big blinds to integer hundredths of a big blind.
+
+    Postflop candidates are rounded to two decimals, so hundredths are the
+    finest unit any bet size in the search carries.
+    """
+    return int(round(size * 100))
+
+
+def same_bet_size(a: float, b: float) -> bool:
+    """True if two bet sizes are equal once expressed in hundredths of a BB."""
+    return to_centi_bb(a) == to_centi_bb(b)
+
+
 def normalize_bet_size(bet_size: float, stack_size: int) -> float:
     """
     Normalize bet size to ensure it's valid (not negative, not exceeding stack).
@@ -206,7 +221,7 @@ def get_action_type(
         # Facing a bet
         if bet_size == 0:
             return "fold"
-        if abs(bet_size - opponent_bet_size) < 0.01:
+        if same_bet_size(bet_size, opponent_bet_size):
             return "call"
         if bet_size > opponent_bet_size:
             return "raise"
@@ -5,22 +5,23 @@ Uses A* and brute-force optimization to find optimal bet sizes that maximize exp
 
 from typing import Tuple, Optional, List, Dict, Any
 from dataclasses import dataclass
-from heapq import heappush, heappop
+from functools import lru_cache
+from heapq import heapify, heappop
 import logging
 import importlib.util
 from pathlib import Path
 
-import project_paths
-
-# Import dependencies (guard against duplicate path entries)
-_module2_dir = Path(__file__).parent
-project_paths.ensure_paths((_module2_dir,))
-from ev_calculator import calculate_ev, calculate_ev_call, calculate_ev_fold
-from bet_size_discretization import get_bet_sizes_for_scenario, get_action_type
+# Sibling imports: importers of this module already have Module 2 on sys.path.
+from ev_calculator import calculate_ev_batch, calculate_ev_fold, get_hand_equity
+from bet_size_discretization import get_bet_sizes_for_scenario, get_action_type, same_bet_size
 from heuristic import heuristic_hand_strength_based, get_heuristic
 
 logger = logging.getLogger(__name__)
 
+# Below this many candidate sizes, A* settles its answer with a flat scan
+# over the already-priced grid instead of heap operations.
+FLAT_SCAN_MAX_GRID = 64
+
 # Optional Module 1 integration: load propositional_logic_hand_decider if Module 1 exists
 _propositional_logic_hand_decider: Optional[Any] = None
 _module_1_path = Path(__file__).resolve().parent.parent / "Module 1" / "propositional_logic.py"
@@ -40,11 +41,12 @@ if _module_1_path.exists():
 @dataclass
 class SearchNode:
     """Node in the search space representing a bet size."""
+    __slots__ = ("bet_size", "ev", "f_score", "action")
+
     bet_size: float
     ev: float  # Actual EV of this bet size (g(n))
     f_score: float  # f(n) = g(n) + h(n) for A*
     action: str  # "fold", "call", "raise", or "open"
-    parent: Optional['SearchNode'] = None
     
     def __lt__(self, other):
         """For priority queue: lower f_score = higher priority (we're maximizing EV)."""
@@ -77,9 +79,6 @@ def _effective_equity_from_context(
 
     This intentionally remains lightweight and deterministic.
     """
-    # Local import to avoid unused import cycles.
-    from ev_calculator import get_hand_equity
-
     eq = get_hand_equity(hand)
     st = (street or "preflop").strip().lower()
     if st == "flop":
@@ -160,6 +159,9 @@ def a_star_search(
         pot_size: Current pot size
         heuristic_type: Type of heuristic to use
     
+    Results are memoized on the exact arguments (see ``clear_cache``); each
+    call returns a fresh dict, so callers may mutate it.
+    
     Returns:
         Dictionary with:
         - "action": "fold", "call", or "raise"/"open"
@@ -168,6 +170,62 @@ def a_star_search(
         - "search_method": "a_star"
         - "nodes_explored": number of nodes explored
     """
+    features = tuple(sorted(board_features.items())) if board_features else None
+    try:
+        result = _a_star_search_cached(
+            hand, position, tuple(stack_sizes), opponent_tendency, opponent_bet_size,
+            pot_size, heuristic_type, street, features, spr, equity_override,
+        )
+    except TypeError:
+        # Unhashable board feature values: search without the memo.
+        result = _a_star_search_uncached(
+            hand, position, stack_sizes, opponent_tendency, opponent_bet_size,
+            pot_size, heuristic_type, street, board_features, spr, equity_override,
+        )
+    return dict(result)
+
+
+@lru_cache(maxsize=4096)
+def _a_star_search_cached(
+    hand: str,
+    position: str,
+    stack_sizes: Tuple[int, int],
+    opponent_tendency: str,
+    opponent_bet_size: Optional[float],
+    pot_size: float,
+    heuristic_type: str,
+    street: str,
+    board_features: Optional[Tuple[Tuple[str, Any], ...]],
+    spr: Optional[float],
+    equity_override: Optional[float],
+) -> Dict:
+    return _a_star_search_uncached(
+        hand, position, stack_sizes, opponent_tendency, opponent_bet_size,
+        pot_size, heuristic_type, street,
+        dict(board_features) if board_features is not None else None,
+        spr, equity_override,
+    )
+
+
+def clear_cache() -> None:
+    """Drop memoized ``a_star_search`` results."""
+    _a_star_search_cached.cache_clear()
+
+
+def _a_star_search_uncached(
+    hand: str,
+    position: str,
+    stack_sizes: Tuple[int, int],
+    opponent_tendency: str,
+    opponent_bet_size: Optional[float] = None,
+    pot_size: float = 1.5,
+    heuristic_type: str = "hand_strength",
+    street: str = "preflop",
+    board_features: Optional[Dict[str, Any]] = None,
+    spr: Optional[float] = None,
+    equity_override: Optional[float] = None,
+) -> Dict:
+    """A* search over the bet-size grid; ``a_star_search`` is the memoized entry point."""
     your_stack, _ = stack_sizes
     
     # Get all possible bet sizes (search space)
@@ -207,48 +265,66 @@ def a_star_search(
         action="fold",
     )
     
-    # Priority queue: nodes ordered by f_score (highest first for maximizing)
-    open_set: List[SearchNode] = []
-    
-    # Add all bet sizes to open set with their f_scores
-    for bet_size in bet_sizes:
-        node = _create_search_node_for_bet_size(
-            bet_size=bet_size,
-            hand=hand,
-            position=position,
-            stack_sizes=stack_sizes,
-            opponent_tendency=opponent_tendency,
-            opponent_bet_size=opponent_bet_size,
-            pot_size=pot_size,
-            h_score=h_score,
-            street=street,
-            board_features=board_features,
-            spr=spr,
-            equity_override=equity_override,
-        )
-        if node is not None:
-            heappush(open_set, node)
+    # Add all bet sizes to open set with their f_scores. Sizes that would be
+    # a fold (below the bet we face) are skipped as invalid or dominated.
+    candidates = [
+        (bet_size, "open" if opponent_bet_size is None
+         else get_action_type(bet_size, opponent_bet_size, your_stack))
+        for bet_size in bet_sizes
+    ]
+    candidates = [(b, a) for b, a in candidates if a != "fold"]
+    evs = calculate_ev_batch(
+        [b for b, _ in candidates],
+        [a for _, a in candidates],
+        hand,
+        position,
+        stack_sizes,
+        opponent_tendency,
+        pot_size,
+        opponent_bet_size,
+        street=street,
+        board_features=board_features,
+        spr=spr,
+        equity_override=equity_override,
+    )
+    if h_score >= 0.0 and len(candidates) < FLAT_SCAN_MAX_GRID:
+        best_node, nodes_explored = _best_by_flat_scan(candidates, evs, h_score, best_node)
+    else:
+        # Priority queue: highest f_score first (we're maximizing). Each bet size is
+        # a distinct state that is pushed exactly once, so there is never a stale
+        # entry to skip; plain (-f, index, node) tuples compare in C and ties keep
+        # grid order.
+        open_set: List[Tuple[float, int, SearchNode]] = [
+            (-(g_score + h_score), i, SearchNode(
+                bet_size=bet_size,
+                ev=g_score,
+                f_score=g_score + h_score,
+                action=action,
+            ))
+            for i, ((bet_size, action), g_score) in enumerate(zip(candidates, evs))
+        ]
+        heapify(open_set)
     
-    # A* exploration: process nodes in order of f_score
-    nodes_explored = 0
+        # A* exploration: process nodes in order of f_score
+        nodes_explored = 0
     
-    while open_set:
-        current = heappop(open_set)
-        nodes_explored += 1
+        while open_set:
+            current = heappop(open_set)[2]
+            nodes_explored += 1
         
-        # Update best if this node has higher actual EV
-        if current.ev > best_node.ev:
-            best_node = current
+            # Update best if this node has higher actual EV
+            if current.ev > best_node.ev:
+                best_node = current
         
-        # Early termination: if current node cannot beat the best EV even
-        # under the optimistic heuristic, no remaining nodes can either.
-        if _should_terminate_search(current, best_node):
-            break
+            # Early termination: if current node cannot beat the best EV even
+            # under the optimistic heuristic, no remaining nodes can either.
+            if _should_terminate_search(current, best_node):
+                break
     
     # Determine final action
     if best_node.bet_size == 0.0:
         final_action = "fold"
-    elif opponent_bet_size and abs(best_node.bet_size - opponent_bet_size) < 0.01:
+    elif opponent_bet_size and same_bet_size(best_node.bet_size, opponent_bet_size):
         final_action = "call"
     elif opponent_bet_size and best_node.bet_size > opponent_bet_size:
         final_action = "raise"
@@ -264,73 +340,31 @@ def a_star_search(
     }
 
 
-def _create_search_node_for_bet_size(
-    bet_size: float,
-    hand: str,
-    position: str,
-    stack_sizes: Tuple[int, int],
-    opponent_tendency: str,
-    opponent_bet_size: Optional[float],
-    pot_size: float,
+def _best_by_flat_scan(
+    candidates: List[Tuple[float, str]],
+    evs: List[float],
     h_score: float,
-    street: str = "preflop",
-    board_features: Optional[Dict[str, Any]] = None,
-    spr: Optional[float] = None,
-    equity_override: Optional[float] = None,
-) -> Optional[SearchNode]:
-    """
-    Create a SearchNode for a given bet size, or return None if the bet size
-    corresponds to an invalid action in this scenario.
+    fold_node: SearchNode,
+) -> Tuple[SearchNode, int]:
     """
-    your_stack, _ = stack_sizes
-    
-    # Determine action type
-    if opponent_bet_size is None:
-        action = "open"
-    else:
-        action = get_action_type(bet_size, opponent_bet_size, your_stack)
-        if action == "fold":
-            return None  # Skip invalid or dominated sizes
+    Settle on the node A* would return with one pass instead of a heap.
     
-    # Calculate actual EV (g(n))
-    if action == "call":
-        g_score = calculate_ev_call(
-            hand,
-            position,
-            stack_sizes,
-            opponent_tendency,
-            opponent_bet_size,
-            pot_size,
-            street=street,
-            board_features=board_features,
-            spr=spr,
-            equity_override=equity_override,
-        )
-    else:  # raise or open
-        g_score = calculate_ev(
-            bet_size,
-            hand,
-            position,
-            stack_sizes,
-            opponent_tendency,
-            pot_size,
-            opponent_bet_size,
-            action,
-            street=street,
-            board_features=board_features,
-            spr=spr,
-            equity_override=equity_override,
-        )
-    
-    # f(n) = g(n) + h(n)
-    f_score = g_score + h_score
-    
-    return SearchNode(
-        bet_size=bet_size,
-        ev=g_score,
-        f_score=f_score,
-        action=action,
-    )
+    Valid when h(n) >= 0: A* then expands the max-EV size first and nothing
+    after it can improve on it, so the answer is the first max-EV size (if it
+    beats folding). ``nodes_explored`` is reproduced as every node with
+    f >= best EV plus the node whose expansion triggers termination.
+    """
+    best = fold_node
+    for (bet_size, action), g_score in zip(candidates, evs):
+        if g_score > best.ev:
+            best = SearchNode(
+                bet_size=bet_size,
+                ev=g_score,
+                f_score=g_score + h_score,
+                action=action,
+            )
+    reached = sum(1 for g_score in evs if g_score + h_score >= best.ev)
+    return best, min(len(evs), reached + 1)
 
 
 def _should_terminate_search(current: SearchNode, best_node: SearchNode) -> bool:
@@ -396,6 +430,7 @@ def find_max_ev_bet_size(
     nodes_explored = 1  # Fold option
     
     # Evaluate all bet sizes and find the one with maximum EV
+    candidates = []
     for bet_size in bet_sizes:
         nodes_explored += 1
         
@@ -406,27 +441,19 @@ def find_max_ev_bet_size(
             action = get_action_type(bet_size, opponent_bet_size, your_stack)
             if action == "fold":
                 continue  # Skip invalid
-        
-        # Calculate EV
-        if action == "call":
-            ev = calculate_ev_call(
-                hand, position, stack_sizes, opponent_tendency,
-                opponent_bet_size, pot_size,
-                street=street,
-                board_features=board_features,
-                spr=spr,
-                equity_override=equity_override,
-            )
-        else:  # raise or open
-            ev = calculate_ev(
-                bet_size, hand, position, stack_sizes, opponent_tendency,
-                pot_size, opponent_bet_size, action,
-                street=street,
-                board_features=board_features,
-                spr=spr,
-                equity_override=equity_override,
-            )
-        
+        candidates.append((bet_size, action))
+    
+    evs = calculate_ev_batch(
+        [b for b, _ in candidates],
+        [a for _, a in candidates],
+        hand, position, stack_sizes, opponent_tendency,
+        pot_size, opponent_bet_size,
+        street=street,
+        board_features=board_features,
+        spr=spr,
+        equity_override=equity_override,
+    )
+    for (bet_size, action), ev in zip(candidates, evs):
         # Update best if this has higher EV
         if ev > best_ev:
             best_ev = ev
@@ -6,14 +6,8 @@ This script demonstrates how Module 2 finds optimal bet sizes using
 optimization and A* search.
 """
 
-from pathlib import Path
-
-import project_paths
-
-# Add Module 2 directory to path (demo may be run from project root or from Module 2)
-_module2_dir = Path(__file__).resolve().parent
-project_paths.ensure_paths((_module2_dir,))
-
+# Run as a script: Python puts this file's directory (Module 2) on sys.path,
+# so sibling modules import directly without any sys.path manipulation.
 from bet_sizing_search import optimal_bet_sizing_search
 
 
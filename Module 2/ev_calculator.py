@@ -4,20 +4,16 @@ Calculates the expected value of a bet size given hand, position, stack sizes, a
 """
 
 import logging
+from functools import lru_cache
 from pathlib import Path
-from typing import Tuple, Optional, Dict, Any
+from typing import Tuple, Optional, Dict, Any, Sequence
 import re
 
-import project_paths
-
-# Add parent directory to path to access docs (guard against duplicates)
-_project_root = Path(__file__).parent.parent
-project_paths.ensure_paths((_project_root,))
-
 logger = logging.getLogger(__name__)
 
 # Opponent tendency probability tables
-# Probabilities of opponent actions (fold, call, raise) given our bet size
+# Probabilities of opponent actions (fold, call, raise) given our bet size.
+# Only read while building _ADJUSTED_PROBS at import; the EV hot path indexes that.
 OPPONENT_PROBABILITIES = {
     "Tight": {
         "fold": 0.70,  # Tight players fold more often
@@ -75,69 +71,87 @@ STREET_BASE_MULTIPLIERS = {
 }
 
 
-def _get_bet_size_category(bet_size: float) -> str:
-    """Return 'small', 'medium', or 'large' based on bet size in BB."""
+# Integer bet size categories (index into _CATEGORY_NAMES / the probability table).
+CAT_SMALL = 0
+CAT_MEDIUM = 1
+CAT_LARGE = 2
+_CATEGORY_NAMES = ("small", "medium", "large")
+
+# Opponent tendencies as small ints, in OPPONENT_PROBABILITIES order.
+_TENDENCY_IDX = {name: i for i, name in enumerate(OPPONENT_PROBABILITIES)}
+_TENDENCY_UNKNOWN = _TENDENCY_IDX["Unknown"]
+
+
+def _bet_size_category_index(bet_size: float) -> int:
+    """Return CAT_SMALL, CAT_MEDIUM, or CAT_LARGE based on bet size in BB."""
+    # Two comparisons beat bisect_left((SMALL_MAX, MEDIUM_MAX), bet_size) in
+    # CPython, even with bisect inlined at the call site.
     if bet_size <= BET_SIZE_SMALL_MAX:
-        return "small"
+        return CAT_SMALL
     if bet_size <= BET_SIZE_MEDIUM_MAX:
-        return "medium"
-    return "large"
+        return CAT_MEDIUM
+    return CAT_LARGE
 
 
-def _get_adjusted_opponent_probs(
-    opponent_tendency: str,
-    bet_size: float,
-    street: str = "preflop",
-    board_features: Optional[Dict[str, Any]] = None,
-    spr: Optional[float] = None,
-) -> dict[str, float]:
-    """
-    Get opponent probabilities adjusted for bet size category.
-    
-    Larger bets induce more folds; smaller bets get more calls.
-    """
-    opp_probs = OPPONENT_PROBABILITIES.get(
-        opponent_tendency.strip(),
-        OPPONENT_PROBABILITIES["Unknown"]
-    )
-    category = _get_bet_size_category(bet_size)
+def _get_bet_size_category(bet_size: float) -> str:
+    """Return 'small', 'medium', or 'large' based on bet size in BB."""
+    return _CATEGORY_NAMES[_bet_size_category_index(bet_size)]
+
+
+def _spr_band(spr: Optional[float]) -> str:
+    """Collapse SPR to the bands the pressure profile distinguishes."""
+    if spr is None:
+        return "none"
+    if spr <= 2.0:
+        return "low"
+    if spr >= 8.0:
+        return "high"
+    return "none"
+
+
+def _compute_adjusted_probs(
+    tendency: str,
+    category: str,
+    street_key: str,
+    spr_band: str,
+    wet: bool,
+    flush_draw: bool,
+    paired: bool,
+) -> Tuple[float, float, float]:
+    """Adjusted (fold, call, raise) for one fully-resolved key; see ``_ADJUSTED_PROBS``."""
+    opp_probs = OPPONENT_PROBABILITIES[tendency]
     mult_fold, mult_call, mult_raise = BET_SIZE_ADJUSTMENTS[category]
     
     fold_prob = opp_probs["fold"] * mult_fold
     call_prob = opp_probs["call"] * mult_call
     raise_prob = opp_probs["raise"] * mult_raise
 
-    street_key = street.strip().lower()
-    s_fold, s_call, s_raise = STREET_BASE_MULTIPLIERS.get(
-        street_key, STREET_BASE_MULTIPLIERS["preflop"]
-    )
+    s_fold, s_call, s_raise = STREET_BASE_MULTIPLIERS[street_key]
     fold_prob *= s_fold
     call_prob *= s_call
     raise_prob *= s_raise
 
     # SPR-aware pressure profile.
-    if spr is not None:
-        if spr <= 2.0:
-            # Low SPR: fewer folds, more stack-off dynamics.
-            fold_prob *= 0.90
-            call_prob *= 1.05
-            raise_prob *= 1.05
-        elif spr >= 8.0:
-            fold_prob *= 1.05
-            call_prob *= 1.00
-            raise_prob *= 0.95
+    if spr_band == "low":
+        # Low SPR: fewer folds, more stack-off dynamics.
+        fold_prob *= 0.90
+        call_prob *= 1.05
+        raise_prob *= 1.05
+    elif spr_band == "high":
+        fold_prob *= 1.05
+        call_prob *= 1.00
+        raise_prob *= 0.95
 
     # Lightweight board-texture adjustment.
-    bf = board_features or {}
-    if bf.get("wet", False):
+    if wet:
         fold_prob *= 0.95
         call_prob *= 1.00
         raise_prob *= 1.10
-    if bf.get("flush_draw", False):
+    if flush_draw:
         fold_prob *= 0.95
         call_prob *= 1.03
         raise_prob *= 1.02
-    if bf.get("paired", False):
+    if paired:
         fold_prob *= 1.03
         call_prob *= 1.00
         raise_prob *= 0.97
@@ -145,11 +159,83 @@ def _get_adjusted_opponent_probs(
     # Renormalize to sum to 1
     total = fold_prob + call_prob + raise_prob
     if total <= 0:
-        return opp_probs
+        return opp_probs["fold"], opp_probs["call"], opp_probs["raise"]
+    return fold_prob / total, call_prob / total, raise_prob / total
+
+
+# Every input to the adjustment is discrete, so all results are built once here.
+# Key: (tendency, street, SPR band, wet, flush_draw, paired); value: one
+# (fold, call, raise) tuple per bet size category, indexed by CAT_*.
+_ProbsContext = Tuple[int, str, str, bool, bool, bool]
+_ADJUSTED_PROBS: Dict[_ProbsContext, Tuple[Tuple[float, float, float], ...]] = {
+    (_TENDENCY_IDX[tendency], street_key, spr_band, wet, flush_draw, paired): tuple(
+        _compute_adjusted_probs(
+            tendency, _CATEGORY_NAMES[category], street_key, spr_band, wet, flush_draw, paired
+        )
+        for category in (CAT_SMALL, CAT_MEDIUM, CAT_LARGE)
+    )
+    for tendency in OPPONENT_PROBABILITIES
+    for street_key in STREET_BASE_MULTIPLIERS
+    for spr_band in ("none", "low", "high")
+    for wet in (False, True)
+    for flush_draw in (False, True)
+    for paired in (False, True)
+}
+
+
+def _probs_by_category(
+    opponent_tendency: str,
+    street: str = "preflop",
+    board_features: Optional[Dict[str, Any]] = None,
+    spr: Optional[float] = None,
+) -> Tuple[Tuple[float, float, float], ...]:
+    """Adjusted (fold, call, raise) for each bet size category in this context."""
+    tendency = _TENDENCY_IDX.get(opponent_tendency.strip(), _TENDENCY_UNKNOWN)
+    street_key = street.strip().lower()
+    if street_key not in STREET_BASE_MULTIPLIERS:
+        street_key = "preflop"
+    bf = board_features or {}
+    return _ADJUSTED_PROBS[(
+        tendency,
+        street_key,
+        _spr_band(spr),
+        bool(bf.get("wet", False)),
+        bool(bf.get("flush_draw", False)),
+        bool(bf.get("paired", False)),
+    )]
+
+
+def _adjusted_probs(
+    opponent_tendency: str,
+    bet_size: float,
+    street: str = "preflop",
+    board_features: Optional[Dict[str, Any]] = None,
+    spr: Optional[float] = None,
+) -> Tuple[float, float, float]:
+    """(fold, call, raise) probabilities adjusted for bet size, street, SPR and board."""
+    by_category = _probs_by_category(opponent_tendency, street, board_features, spr)
+    return by_category[_bet_size_category_index(bet_size)]
+
+
+def _get_adjusted_opponent_probs(
+    opponent_tendency: str,
+    bet_size: float,
+    street: str = "preflop",
+    board_features: Optional[Dict[str, Any]] = None,
+    spr: Optional[float] = None,
+) -> dict[str, float]:
+    """
+    Get opponent probabilities adjusted for bet size category.
+    
+    Larger bets induce more folds; smaller bets get more calls.
+    """
+    fold_prob, call_prob, raise_prob = _adjusted_probs(
+        opponent_tendency, bet_size, street=street, board_features=board_features, spr=spr
+    )
     return {
-        "fold": fold_prob / total,
-        "call": call_prob / total,
-        "raise": raise_prob / total,
+        "fold": fold_prob,
+        "call": call_prob,
+        "raise": raise_prob,
     }
 
 
@@ -184,8 +270,8 @@ def load_hand_equity() -> dict[str, float]:
     return equity_dict
 
 
-# Hand equity table (loaded lazily for better import-time hygiene)
-HAND_EQUITY: dict[str, float] = {}
+# Hand equity table, parsed once at import (169 rows; well under a millisecond).
+HAND_EQUITY: dict[str, float] = load_hand_equity()
 
 
 def normalize_hand(hand: str) -> Optional[str]:
@@ -241,9 +327,31 @@ def normalize_hand(hand: str) -> Optional[str]:
     return None
 
 
+def _build_equity_by_spelling() -> dict[str, float]:
+    """Equity keyed by common spellings (either rank order, any case, s/o suffix)."""
+    candidates = {"ace king suited", "ace king offsuit", "pocket aces", "aces", "kings", "queens"}
+    for hand in HAND_EQUITY:
+        for two in (hand[:2], hand[1::-1]):
+            for ranks in (two, two.lower()):
+                for suffix in ("", "s", "o", "S", "O"):
+                    candidates.add(ranks + suffix)
+    table: dict[str, float] = {}
+    for spelling in candidates:
+        normalized = normalize_hand(spelling)
+        if normalized is not None and normalized in HAND_EQUITY:
+            table[spelling] = HAND_EQUITY[normalized]
+    return table
+
+
+_EQUITY_BY_SPELLING: dict[str, float] = _build_equity_by_spelling()
+
+
 def get_hand_equity(hand: str) -> float:
     """
     Get hand equity (win percentage) for a given hand.
+
+    Common spellings resolve with one dict lookup in a table frozen at import;
+    anything else goes through ``normalize_hand``.
     
     Args:
         hand: Hand notation
@@ -251,11 +359,9 @@ def get_hand_equity(hand: str) -> float:
     Returns:
         Equity as float (0.0 to 1.0), or 0.5 if hand not found (default to coin flip).
     """
-    global HAND_EQUITY
-    # Lazy-load equity data on first use to avoid heavy work at import time.
-    if not HAND_EQUITY:
-        HAND_EQUITY = load_hand_equity()
-    
+    equity = _EQUITY_BY_SPELLING.get(hand)
+    if equity is not None:
+        return equity
     normalized = normalize_hand(hand)
     if normalized and normalized in HAND_EQUITY:
         return HAND_EQUITY[normalized]
@@ -302,6 +408,55 @@ def calculate_ev(
     Returns:
         Expected value in big blinds.
     """
+    if board_features is None:
+        # Preflop/featureless calls are memoized; board feature dicts are not
+        # hashable, so those callers are priced directly.
+        return _calculate_ev_cached(
+            bet_size, hand, position, tuple(stack_sizes), opponent_tendency,
+            pot_size, opponent_bet_size, action, street, spr, equity_override,
+        )
+    return _calculate_ev_uncached(
+        bet_size, hand, position, stack_sizes, opponent_tendency,
+        pot_size, opponent_bet_size, action, street, board_features, spr,
+        equity_override,
+    )
+
+
+@lru_cache(maxsize=4096)
+def _calculate_ev_cached(
+    bet_size: float,
+    hand: str,
+    position: str,
+    stack_sizes: Tuple[int, int],
+    opponent_tendency: str,
+    pot_size: float,
+    opponent_bet_size: Optional[float],
+    action: str,
+    street: str,
+    spr: Optional[float],
+    equity_override: Optional[float],
+) -> float:
+    return _calculate_ev_uncached(
+        bet_size, hand, position, stack_sizes, opponent_tendency,
+        pot_size, opponent_bet_size, action, street, None, spr,
+        equity_override,
+    )
+
+
+def _calculate_ev_uncached(
+    bet_size: float,
+    hand: str,
+    position: str,
+    stack_sizes: Tuple[int, int],
+    opponent_tendency: str,
+    pot_size: float,
+    opponent_bet_size: Optional[float],
+    action: str,
+    street: str,
+    board_features: Optional[Dict[str, Any]],
+    spr: Optional[float],
+    equity_override: Optional[float],
+) -> float:
     # Determine our investment and updated pot size for this scenario
     our_investment, pot_size = _get_investment_and_pot_size(
         bet_size=bet_size,
@@ -318,21 +473,35 @@ def calculate_ev(
     # Small bets (2x-2.5x): more calls, fewer folds
     # Medium bets (3x-4x): base probabilities
     # Large bets (5x+): more folds, fewer calls
-    opp_probs = _get_adjusted_opponent_probs(
+    fold_prob, call_prob, raise_prob = _adjusted_probs(
         opponent_tendency,
         our_investment,
         street=street,
         board_features=board_features,
         spr=spr,
     )
-    fold_prob = opp_probs["fold"]
-    call_prob = opp_probs["call"]
-    raise_prob = opp_probs["raise"]
     
     # Get hand equity
     equity = equity_override if equity_override is not None else get_hand_equity(hand)
     equity = max(0.05, min(0.95, equity))
     
+    return _ev_from_probs(
+        fold_prob, call_prob, raise_prob, equity,
+        our_investment, pot_size, opponent_bet_size, action,
+    )
+
+
+def _ev_from_probs(
+    fold_prob: float,
+    call_prob: float,
+    raise_prob: float,
+    equity: float,
+    our_investment: float,
+    pot_size: float,
+    opponent_bet_size: Optional[float],
+    action: str,
+) -> float:
+    """EV formula of ``calculate_ev`` once probabilities, equity and investment are known."""
     # EV component 1: Opponent folds
     # We win the pot without further investment
     ev_fold = fold_prob * pot_size
@@ -449,6 +618,53 @@ def calculate_ev_for_bet_sizes(
     return results
 
 
+def calculate_ev_batch(
+    bet_sizes: Sequence[float],
+    actions: Sequence[str],
+    hand: str,
+    position: str,
+    stack_sizes: Tuple[int, int],
+    opponent_tendency: str,
+    pot_size: float = BASE_POT_SIZE,
+    opponent_bet_size: Optional[float] = None,
+    street: str = "preflop",
+    board_features: Optional[Dict[str, Any]] = None,
+    spr: Optional[float] = None,
+    equity_override: Optional[float] = None,
+) -> list[float]:
+    """
+    EV of each ``(bet_size, action)`` pair over a whole bet-size grid.
+    
+    Same values as calling ``calculate_ev`` once per pair, but equity and the
+    per-category opponent probabilities are resolved once for the grid.
+    
+    Returns:
+        List of EVs aligned with ``bet_sizes``.
+    """
+    by_category = _probs_by_category(opponent_tendency, street, board_features, spr)
+    equity = equity_override if equity_override is not None else get_hand_equity(hand)
+    equity = max(0.05, min(0.95, equity))
+    
+    evs = []
+    for bet_size, action in zip(bet_sizes, actions):
+        our_investment, updated_pot = _get_investment_and_pot_size(
+            bet_size=bet_size,
+            stack_sizes=stack_sizes,
+            pot_size=pot_size,
+            opponent_bet_size=opponent_bet_size,
+            action=action,
+        )
+        if our_investment <= 0:
+            evs.append(0.0)
+            continue
+        fold_prob, call_prob, raise_prob = by_category[_bet_size_category_index(our_investment)]
+        evs.append(_ev_from_probs(
+            fold_prob, call_prob, raise_prob, equity,
+            our_investment, updated_pot, opponent_bet_size, action,
+        ))
+    return evs
+
+
 def calculate_ev_fold(
     opponent_bet_size: float,
     pot_size: float = BASE_POT_SIZE
@@ -8,16 +8,10 @@ Heuristics vs Optimization:
 """
 
 from typing import Tuple, Optional
-from pathlib import Path
-
-import project_paths
-
-# Import from same module (guard against duplicate path entries)
-_module2_dir = Path(__file__).parent
-project_paths.ensure_paths((_module2_dir,))
 
+# Sibling imports: importers of this module already have Module 2 on sys.path.
 from ev_calculator import calculate_ev, get_hand_equity
-from bet_size_discretization import get_bet_sizes_for_scenario, is_all_in
+from bet_size_discretization import get_bet_sizes_for_scenario, is_all_in, same_bet_size
 
 
 def find_max_ev(
@@ -70,7 +64,7 @@ def find_max_ev(
             action = "open"
         else:
             # Determine action type
-            if abs(bet_size - opponent_bet_size) < 0.01:
+            if same_bet_size(bet_size, opponent_bet_size):
                 action = "call"
             elif bet_size > opponent_bet_size:
                 action = "raise"
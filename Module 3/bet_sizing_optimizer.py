@@ -8,6 +8,7 @@ and choosing the action that maximizes simulated value.
 
 from __future__ import annotations
 
+import random
 from typing import Dict, Tuple, Optional, List, Any
 
 from monte_carlo_simulator import run_simulation
@@ -34,6 +35,10 @@ def optimize_opening_actions(
     "open to X" for each candidate bet size; choose the action (fold or open to X)
     that maximizes simulated value.
 
+    All candidate sizes for a hand share one seed (common random numbers), so
+    their estimates see the same opponent/showdown draws and the comparison
+    reflects the sizing rather than sampling noise.
+
     Args:
         position: "Button" or "Big Blind".
         stack_sizes: (your_stack, opponent_stack) in BB.
@@ -52,7 +57,7 @@ def optimize_opening_actions(
         - "confidence_interval": (lower, upper) for strategy value.
         - "hand_recommendations": list of (hand, action, value_estimate).
     """
-    rng_seed = seed
+    rng = random.Random(seed)
     hands_to_use = list(hands) if hands is not None else list(DEFAULT_HANDS)
     bet_sizes = list(candidate_bet_sizes) if candidate_bet_sizes is not None else list(DEFAULT_BET_SIZES)
 
@@ -60,6 +65,8 @@ def optimize_opening_actions(
     hand_recommendations: List[Dict[str, Any]] = []
 
     for hand in hands_to_use:
+        hand_seed = rng.randint(0, 2**31 - 1)
+
         # Evaluate fold (baseline 0.0)
         best_action = "fold"
         best_bet_size = 0.0
@@ -76,7 +83,7 @@ def optimize_opening_actions(
                 opponent_tendency=opponent_tendency,
                 num_trials=num_simulations,
                 pot_size=1.5,
-                seed=rng_seed,
+                seed=hand_seed,
             )
             value_estimate = result["value_estimate"]
             if value_estimate > best_value:
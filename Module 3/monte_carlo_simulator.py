@@ -9,8 +9,9 @@ sampling instead of a single preflop discount heuristic.
 
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
-from typing import Tuple, Dict, Optional, List, Any, Callable
+from typing import Tuple, Dict, Optional, List, Any, Callable, Iterable
 import math
 import random
 import re
@@ -133,10 +134,11 @@ def _load_hand_equity() -> Dict[str, float]:
 HAND_EQUITY: Dict[str, float] = _load_hand_equity()
 
 
+@lru_cache(maxsize=256)
 def get_hand_equity(hand: str) -> float:
     """
     Get approximate pre-flop equity for a hand from the equity table.
-    Defaults to 0.5 (coin flip) if not found.
+    Defaults to 0.5 (coin flip) if not found. Memoized per hand string.
     """
     key = _normalize_hand_notation(hand)
     return HAND_EQUITY.get(key, 0.5)
@@ -207,13 +209,14 @@ def _bet_size_adjustment(bet_size: float) -> float:
     return _logistic(x)  # ~0.5 at 3x, >0.5 for larger, <0.5 for smaller
 
 
-def _get_adjusted_opponent_probs(
-    opponent_tendency: str,
-    bet_size: float,
-) -> Dict[str, float]:
+@lru_cache(maxsize=1024)
+def _adjusted_probs(opponent_tendency: str, bet_size: float) -> Tuple[float, float, float]:
     """
     Adjust base opponent probabilities using a logistic function of bet size.
 
+    Returns a shared (fold, call, raise) tuple; a simulation samples the same
+    (tendency, bet size) on every trial, so each pair is computed once.
+
     Intuition:
     - Larger bets → somewhat more folds, somewhat fewer calls.
     - Smaller bets → somewhat fewer folds, somewhat more calls.
@@ -241,20 +244,25 @@ def _get_adjusted_opponent_probs(
 
     total = fold + call + raise_p
     if total <= 0.0:
-        return base
+        return base["fold"], base["call"], base["raise"]
 
-    return {
-        "fold": fold / total,
-        "call": call / total,
-        "raise": raise_p / total,
-    }
+    return fold / total, call / total, raise_p / total
+
+
+def _get_adjusted_opponent_probs(
+    opponent_tendency: str,
+    bet_size: float,
+) -> Dict[str, float]:
+    """Dict view of ``_adjusted_probs`` (fold / call / raise)."""
+    fold, call, raise_p = _adjusted_probs(opponent_tendency, bet_size)
+    return {"fold": fold, "call": call, "raise": raise_p}
 
 
 def _full_deck_cards() -> List[Any]:
     """All 52 cards as ``full_game_engine.cards.Card`` instances."""
-    from full_game_engine.cards import Card
+    from full_game_engine.cards import FULL_DECK
 
-    return [Card(r, s) for r in range(13) for s in range(4)]
+    return list(FULL_DECK)
 
 
 def monte_carlo_equity_vs_random_hand(
@@ -285,11 +293,13 @@ def monte_carlo_equity_vs_random_hand(
     hero_hole = (_norm(hero_hole[0]), _norm(hero_hole[1]))
     board = [_norm(c) for c in board]
 
+    used = {hero_hole[0], hero_hole[1], *board}
+    live_cards = [c for c in _full_deck_cards() if c not in used]
+
     wins = 0.0
     done = 0
     for _ in range(num_samples):
-        used = {hero_hole[0], hero_hole[1], *board}
-        deck = [c for c in _full_deck_cards() if c not in used]
+        deck = live_cards[:]
         rng.shuffle(deck)
         if len(deck) < 2:
             break
@@ -441,13 +451,17 @@ def _sample_opponent_action(
     and our bet size, using a logistic adjustment so that larger bets
     induce more folds and smaller bets induce more calls.
     """
-    probs = _get_adjusted_opponent_probs(opponent_tendency, bet_size)
+    fold, call, raise_p = _adjusted_probs(opponent_tendency, bet_size)
     r = rng.random()
-    cumulative = 0.0
-    for action, p in probs.items():
-        cumulative += p
-        if r <= cumulative:
-            return action
+    cumulative = fold
+    if r <= cumulative:
+        return "fold"
+    cumulative += call
+    if r <= cumulative:
+        return "call"
+    cumulative += raise_p
+    if r <= cumulative:
+        return "raise"
     return "call"
 
 
@@ -553,6 +567,50 @@ def run_trial(
     return lose_payoff
 
 
+def _radical_inverse(index: int, base: int) -> float:
+    """Van der Corput radical inverse of ``index`` in ``base`` (Halton coordinate)."""
+    inv_base = 1.0 / base
+    factor = inv_base
+    result = 0.0
+    while index > 0:
+        index, digit = divmod(index, base)
+        result += digit * factor
+        factor *= inv_base
+    return result
+
+
+class _QuasiRandomTrials(random.Random):
+    """
+    RNG stand-in that serves one randomized Halton point per trial.
+
+    A preflop trial draws at most two uniforms (opponent response, showdown),
+    which map to Halton bases 2 and 3. A random shift (Cranley-Patterson
+    rotation) keeps the estimator unbiased; any extra draws fall back to the
+    underlying pseudorandom stream.
+    """
+
+    _BASES = (2, 3)
+
+    def __init__(self, seed: Optional[int] = None) -> None:
+        super().__init__(seed)
+        draw = super().random
+        self._shifts = tuple(draw() for _ in self._BASES)
+        self._trial = 0
+        self._dim = 0
+
+    def start_trial(self, index: int) -> None:
+        """Position the stream at the first coordinate of Halton point ``index + 1``."""
+        self._trial = index + 1
+        self._dim = 0
+
+    def random(self) -> float:
+        dim = self._dim
+        self._dim += 1
+        if dim >= len(self._BASES):
+            return super().random()
+        return (_radical_inverse(self._trial, self._BASES[dim]) + self._shifts[dim]) % 1.0
+
+
 def _empty_simulation_result() -> Dict[str, Any]:
     return {
         "value_estimate": 0.0,
@@ -562,14 +620,23 @@ def _empty_simulation_result() -> Dict[str, Any]:
     }
 
 
-def _mean_std_ci95(values: List[float]) -> Tuple[float, float, Tuple[float, float]]:
-    if not values:
+def _mean_std_ci95(values: Iterable[float]) -> Tuple[float, float, Tuple[float, float]]:
+    """
+    Sample mean, standard deviation, and 95% CI in a single pass (Welford),
+    so callers can stream trial payoffs without materializing a list.
+    """
+    n = 0
+    mean = 0.0
+    m2 = 0.0
+    for v in values:
+        n += 1
+        delta = v - mean
+        mean += delta / n
+        m2 += delta * (v - mean)
+    if n == 0:
         return 0.0, 0.0, (0.0, 0.0)
-    n = len(values)
-    mean = sum(values) / n
     if n > 1:
-        var = sum((v - mean) ** 2 for v in values) / (n - 1)
-        std = math.sqrt(var)
+        std = math.sqrt(m2 / (n - 1))
         margin = 1.96 * std / math.sqrt(n)
     else:
         std = 0.0
@@ -621,20 +688,38 @@ def run_simulation(
     seed: Optional[int] = None,
     hero_hole: Optional[Tuple[Any, Any]] = None,
     board: Optional[List[Any]] = None,
+    rng: Optional[random.Random] = None,
+    quasi_random: bool = False,
 ) -> Dict:
     """
     Run num_trials Monte Carlo trials for (hand, action, bet_size) and return
     sample mean value, standard deviation, and 95% confidence interval.
 
+    With ``quasi_random=True`` preflop trials draw their uniforms from a
+    randomized low-discrepancy (Halton) sequence instead of the PRNG, which
+    typically tightens the estimate for the same ``num_trials``. It is ignored
+    postflop, where equity sampling consumes a variable number of draws.
+
+    If ``rng`` is given it is used as-is (``seed`` is ignored), letting callers
+    that simulate many hands reuse one generator instead of allocating one per call.
+
     When ``hero_hole`` and ``board`` are provided and ``board`` is non-empty,
     equity uses board-aware *conditioned* villain ranges for call vs raise
     (importance sampling), with per-(mode,bet_size) caching inside this run.
+
+    Folds (``action == "fold"`` or ``bet_size <= 0``) return a zero-variance
+    result immediately with ``num_trials == 0``.
     """
-    if num_trials <= 0:
+    # Folding is deterministic (payoff 0 in this model), so no trials are needed.
+    if num_trials <= 0 or action == "fold" or bet_size <= 0.0:
         return _empty_simulation_result()
 
-    rng = random.Random(seed)
-    values: List[float] = []
+    if rng is None:
+        rng = random.Random(seed)
+
+    # Resolve the hand's table equity once per run instead of re-normalizing
+    # the hand string inside every trial.
+    base_equity = get_hand_equity(hand)
 
     postflop_equity_getter: Optional[Callable[[str, float], float]] = None
     if hero_hole is not None and board is not None and len(board) > 0:
@@ -646,22 +731,28 @@ def run_simulation(
             rng=rng,
         )
 
-    for _ in range(num_trials):
-        v = run_trial(
-            hand=hand,
-            action=action,
-            bet_size=bet_size,
-            position=position,
-            stack_sizes=stack_sizes,
-            opponent_tendency=opponent_tendency,
-            pot_size=pot_size,
-            rng=rng,
-            equity_override=None,
-            postflop_equity_getter=postflop_equity_getter,
-        )
-        values.append(v)
+    qmc: Optional[_QuasiRandomTrials] = None
+    if quasi_random and postflop_equity_getter is None:
+        qmc = _QuasiRandomTrials(rng.randrange(2**31))
+
+    def _payoffs():
+        for i in range(num_trials):
+            if qmc is not None:
+                qmc.start_trial(i)
+            yield run_trial(
+                hand=hand,
+                action=action,
+                bet_size=bet_size,
+                position=position,
+                stack_sizes=stack_sizes,
+                opponent_tendency=opponent_tendency,
+                pot_size=pot_size,
+                rng=qmc if qmc is not None else rng,
+                equity_override=base_equity,
+                postflop_equity_getter=postflop_equity_getter,
+            )
 
-    mean, std, ci = _mean_std_ci95(values)
+    mean, std, ci = _mean_std_ci95(_payoffs())
 
     return {
         "value_estimate": mean,
@@ -671,6 +762,24 @@ def run_simulation(
     }
 
 
+def _simulate_strategy_hand(
+    task: Tuple[str, float, str, Tuple[int, int], str, int, int],
+) -> Dict[str, Any]:
+    """Process-pool worker: simulate one hand of a strategy from its own seed."""
+    hand, bet_size, position, stack_sizes, opponent_tendency, num_trials, hand_seed = task
+    return run_simulation(
+        hand=hand,
+        action="fold" if bet_size <= 0.0 else "open",
+        bet_size=bet_size,
+        position=position,
+        stack_sizes=stack_sizes,
+        opponent_tendency=opponent_tendency,
+        num_trials=num_trials,
+        pot_size=1.5,
+        seed=hand_seed,
+    )
+
+
 def run_simulation_for_strategy(
     strategy: Dict[str, float],
     position: str,
@@ -679,37 +788,74 @@ def run_simulation_for_strategy(
     num_trials_per_hand: int = 500,
     hands: Optional[List[str]] = None,
     seed: Optional[int] = None,
+    max_workers: int = 1,
 ) -> Dict:
     """
     Run Monte Carlo simulation for an entire strategy (hand -> opening bet size;
     0.0 denotes fold). Returns overall value estimate and per-hand statistics.
+
+    With ``max_workers > 1`` the open hands are simulated in a process pool.
+    Hands are submitted in chunks (several per task) so pickling/IPC overhead
+    is amortized over whole hands' worth of trials; results are identical to
+    the serial run because every hand keeps its own seed.
     """
     if hands is None:
         hands = list(strategy.keys())
 
     rng = random.Random(seed)
-    per_hand_results: Dict[str, Dict] = {}
-    values: List[float] = []
-
+    tasks = []
     for hand in hands:
-        bet_size = strategy.get(hand, 0.0)
-        action = "fold" if bet_size <= 0.0 else "open"
-
         # Use independent seeds per hand for reproducibility
         hand_seed = rng.randint(0, 2**31 - 1)
-        result = run_simulation(
-            hand=hand,
-            action=action,
-            bet_size=bet_size,
-            position=position,
-            stack_sizes=stack_sizes,
-            opponent_tendency=opponent_tendency,
-            num_trials=num_trials_per_hand,
-            pot_size=1.5,
-            seed=hand_seed,
+        tasks.append(
+            (
+                hand,
+                strategy.get(hand, 0.0),
+                position,
+                stack_sizes,
+                opponent_tendency,
+                num_trials_per_hand,
+                hand_seed,
+            )
         )
+
+    open_tasks = [t for t in tasks if t[1] > 0.0]
+    results: Dict[str, Dict[str, Any]] = {}
+    if max_workers > 1 and len(open_tasks) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        workers = min(max_workers, len(open_tasks))
+        chunk_size = max(1, len(open_tasks) // (4 * workers))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for task, result in zip(
+                open_tasks, pool.map(_simulate_strategy_hand, open_tasks, chunksize=chunk_size)
+            ):
+                results[task[0]] = result
+    else:
+        # One generator reseeded per hand; equivalent to random.Random(hand_seed).
+        trial_rng = random.Random()
+        for task in open_tasks:
+            hand, bet_size, _, _, _, _, hand_seed = task
+            trial_rng.seed(hand_seed)
+            results[hand] = run_simulation(
+                hand=hand,
+                action="open",
+                bet_size=bet_size,
+                position=position,
+                stack_sizes=stack_sizes,
+                opponent_tendency=opponent_tendency,
+                num_trials=num_trials_per_hand,
+                pot_size=1.5,
+                seed=hand_seed,
+                rng=trial_rng,
+            )
+
+    per_hand_results: Dict[str, Dict] = {}
+    values: List[float] = []
+    for hand, bet_size, *_ in tasks:
+        result = results.get(hand) or _empty_simulation_result()
         per_hand_results[hand] = {
-            "action": action,
+            "action": "fold" if bet_size <= 0.0 else "open",
             "bet_size": bet_size,
             **result,
         }
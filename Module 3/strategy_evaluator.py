@@ -8,11 +8,68 @@ and confidence intervals using simulation only—no Module 2 or EV formulas.
 
 from __future__ import annotations
 
-from typing import Dict, Tuple, Optional
+from functools import lru_cache
+from typing import Any, Dict, Tuple, Optional
 
 from monte_carlo_simulator import run_simulation_for_strategy
 
 
+@lru_cache(maxsize=256)
+def _cached_strategy_simulation(
+    strategy_items: Tuple[Tuple[str, float], ...],
+    position: str,
+    stack_sizes: Tuple[int, int],
+    opponent_tendency: str,
+    num_trials: int,
+    seed: int,
+) -> Dict[str, Any]:
+    """
+    Seeded strategy simulation keyed by its full deterministic signature.
+
+    ``strategy_items`` keeps insertion order because per-hand seeds are drawn
+    in hand order, so reordering a strategy changes the sampled values.
+    """
+    return run_simulation_for_strategy(
+        strategy=dict(strategy_items),
+        position=position,
+        stack_sizes=stack_sizes,
+        opponent_tendency=opponent_tendency,
+        num_trials_per_hand=num_trials,
+        hands=None,
+        seed=seed,
+    )
+
+
+def _simulate_strategy(
+    strategy: Dict[str, float],
+    position: str,
+    stack_sizes: Tuple[int, int],
+    opponent_tendency: str,
+    num_trials: int,
+    seed: Optional[int],
+    force_recompute: bool = False,
+) -> Dict[str, Any]:
+    """Run (or fetch the memoized) strategy simulation; treat the result as read-only."""
+    if seed is None or force_recompute:
+        return run_simulation_for_strategy(
+            strategy=strategy,
+            position=position,
+            stack_sizes=stack_sizes,
+            opponent_tendency=opponent_tendency,
+            num_trials_per_hand=num_trials,
+            hands=None,
+            seed=seed,
+        )
+    return _cached_strategy_simulation(
+        tuple(strategy.items()),
+        position,
+        tuple(stack_sizes),
+        opponent_tendency,
+        num_trials,
+        seed,
+    )
+
+
 def evaluate_strategy(
     strategy: Dict[str, float],
     position: str,
@@ -21,6 +78,7 @@ def evaluate_strategy(
     num_trials: int = 1000,
     confidence_level: float = 0.95,
     seed: Optional[int] = None,
+    force_recompute: bool = False,
 ) -> Dict:
     """
     Evaluate a strategy (hand -> opening bet size; 0 or sentinel = fold) using
@@ -33,7 +91,8 @@ def evaluate_strategy(
         opponent_tendency: Opponent tendency category.
         num_trials: Number of trials per hand.
         confidence_level: Currently unused (we always return a 95% CI).
-        seed: Random seed.
+        seed: Random seed. Seeded evaluations are deterministic and memoized.
+        force_recompute: Bypass the memo and rerun the simulation.
 
     Returns:
         Dict with:
@@ -44,26 +103,21 @@ def evaluate_strategy(
         - "strategy": the input strategy.
     """
     # We treat num_trials as the number of trials per hand.
-    sim_result = run_simulation_for_strategy(
-        strategy=strategy,
-        position=position,
-        stack_sizes=stack_sizes,
-        opponent_tendency=opponent_tendency,
-        num_trials_per_hand=num_trials,
-        hands=None,
-        seed=seed,
+    sim_result = _simulate_strategy(
+        strategy, position, stack_sizes, opponent_tendency, num_trials, seed, force_recompute
     )
 
-    per_hand_ev = {
-        hand: res["value_estimate"]
-        for hand, res in sim_result["per_hand_results"].items()
+    # Copy per-hand rows so callers cannot mutate memoized results.
+    per_hand_results = {
+        hand: dict(res) for hand, res in sim_result["per_hand_results"].items()
     }
+    per_hand_ev = {hand: res["value_estimate"] for hand, res in per_hand_results.items()}
 
     return {
         "expected_value": sim_result["expected_value"],
         "confidence_interval": sim_result["confidence_interval"],
         "per_hand_ev": per_hand_ev,
-        "per_hand_results": sim_result["per_hand_results"],
+        "per_hand_results": per_hand_results,
         "strategy": strategy,
     }
 
@@ -84,26 +138,22 @@ def strategy_value_summary(
         Dict with expected_value, confidence_interval, and optional
         list of (hand, action, value_estimate) for key hands.
     """
-    result = evaluate_strategy(
-        strategy=strategy,
-        position=position,
-        stack_sizes=stack_sizes,
-        opponent_tendency=opponent_tendency,
-        num_trials=num_trials,
-        seed=seed,
+    # Build rows straight from the simulation; no intermediate evaluate_strategy dict.
+    sim_result = _simulate_strategy(
+        strategy, position, stack_sizes, opponent_tendency, num_trials, seed
     )
 
     summary_rows = [
         {
             "hand": hand,
             "bet_size": strategy.get(hand, 0.0),
-            "value_estimate": ev,
+            "value_estimate": res["value_estimate"],
         }
-        for hand, ev in result["per_hand_ev"].items()
+        for hand, res in sim_result["per_hand_results"].items()
     ]
 
     return {
-        "expected_value": result["expected_value"],
-        "confidence_interval": result["confidence_interval"],
+        "expected_value": sim_result["expected_value"],
+        "confidence_interval": sim_result["confidence_interval"],
         "hands": summary_rows,
     }
@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import pickle
 import random
+import threading
 from collections import defaultdict
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
@@ -18,6 +19,17 @@ ActionBucket = str
 # Hashable tuple from ``state_encoder.encode_from_hand_state`` (tabular Q key).
 StateKey = Tuple[Any, ...]
 
+# One generator per thread: the threaded web servers share a loaded agent across
+# sessions, and the global ``random`` instance would be contended between them.
+_thread_rng = threading.local()
+
+
+def _rng() -> random.Random:
+    r = getattr(_thread_rng, "r", None)
+    if r is None:
+        r = _thread_rng.r = random.Random()
+    return r
+
 
 class RLPokerAgent:
     """Epsilon-greedy tabular agent with TD or Monte Carlo learning updates."""
@@ -40,12 +52,13 @@ class RLPokerAgent:
 
     def select_action(self, state: StateKey) -> ActionBucket:
         """Epsilon-greedy over the full discrete set (no legality mask)."""
-        if random.random() < self.epsilon:
-            return random.choice(self.actions)
+        rng = _rng()
+        if rng.random() < self.epsilon:
+            return rng.choice(self.actions)
         values = self.q[state]
         best = max(values.values())
         best_actions = [a for a, v in values.items() if v == best]
-        return random.choice(best_actions)
+        return rng.choice(best_actions)
 
     def select_action_masked(
         self, state: StateKey, legal_buckets: Sequence[str]
@@ -61,12 +74,13 @@ class RLPokerAgent:
         masked = [b for b in legal_buckets if b in self.actions]
         if not masked:
             return self.select_action(state)
-        if random.random() < self.epsilon:
-            return random.choice(masked)
+        rng = _rng()
+        if rng.random() < self.epsilon:
+            return rng.choice(masked)
         values = self.q[state]
         best_val = max(values.get(b, 0.0) for b in masked)
         best = [b for b in masked if values.get(b, 0.0) == best_val]
-        return random.choice(best)
+        return rng.choice(best)
 
     def select_action_masked_with_bonus(
         self,
@@ -85,8 +99,9 @@ class RLPokerAgent:
         masked = [b for b in legal_buckets if b in self.actions]
         if not masked:
             return self.select_action(state)
-        if random.random() < self.epsilon:
-            return random.choice(masked)
+        rng = _rng()
+        if rng.random() < self.epsilon:
+            return rng.choice(masked)
         values = self.q[state]
         scored = []
         for b in masked:
@@ -95,7 +110,7 @@ class RLPokerAgent:
             scored.append((b, score))
         best_val = max(sc for _, sc in scored)
         best = [b for b, sc in scored if sc == best_val]
-        return random.choice(best)
+        return rng.choice(best)
 
     def update(
         self,
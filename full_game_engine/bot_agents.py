@@ -6,6 +6,7 @@ from __future__ import annotations
 
 import os
 import random
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Optional, Tuple
 
@@ -182,8 +183,12 @@ def _load_rl_agent(agent_key: str) -> Optional[RLPokerAgent]:
     return agent
 
 
+@lru_cache(maxsize=None)
 def _load_module4_choose_with_meta():
-    """Import Module 4 ``choose_preflop_action_with_meta`` (folder has a space)."""
+    """Import Module 4 ``choose_preflop_action_with_meta`` (folder has a space).
+
+    Resolved once per process; later bot turns reuse the cached function.
+    """
     if not _M4_DIR.is_dir():
         return None
     project_paths.ensure_paths((_M4_DIR,))
@@ -235,6 +240,26 @@ def _m4_action(
         return random_legal_action(state, rng), {"fallback": "random_legal", "error": str(e)}
 
 
+def warm_up() -> None:
+    """Load the RL policies and resolve the lazy Module 2/4 imports.
+
+    Call once at server start so the first bot turn does not pay the cold path.
+    """
+    for agent_key in ("rl", "rl_optimal", "rl_coverage"):
+        _load_rl_agent(agent_key)
+    _load_module4_choose_with_meta()
+    if optimal_bet_sizing_search is not None:
+        # Loads Module 2's equity table and its Module 1 playability filter.
+        optimal_bet_sizing_search(
+            hand="AA",
+            position="Button",
+            stack_sizes=(50, 50),
+            opponent_tendency="Unknown",
+            search_algorithm="a_star",
+            use_module1=True,
+        )
+
+
 def pick_bot_action(
     agent: Optional[str], state: HandState, rng: random.Random
 ) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
@@ -9,7 +9,7 @@ from __future__ import annotations
 
 import random
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Literal, Optional, Tuple
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple
 
 from full_game_engine.cards import Card, new_deck
 from full_game_engine.hand_eval import compare_at_showdown
@@ -263,6 +263,86 @@ def raise_amount_range(state: HandState) -> Optional[Dict[str, int]]:
     return {"min": min_raise_to, "max": max_total, "step": 1}
 
 
+def _apply_fold(state: HandState, p: int, action: Dict[str, Any]) -> None:
+    w = state._other(p)
+    state.winner = w
+    state.stacks[w] += state.pot
+    state.pot = 0
+    state.phase = "hand_over"
+
+
+def _apply_check(state: HandState, p: int, action: Dict[str, Any]) -> None:
+    if state.to_call(p) != 0:
+        raise ValueError("Cannot check with amount to call")
+    state.acted[p] = True
+    if _round_closed(state):
+        _advance_street(state)
+    else:
+        state.actor = state._other(p)
+
+
+def _apply_call(state: HandState, p: int, action: Dict[str, Any]) -> None:
+    tc = state.to_call(p)
+    if tc <= 0:
+        raise ValueError("Nothing to call")
+    # Allow all-in calls for less than full to-call.
+    pay = min(tc, state.stacks[p])
+    if pay <= 0:
+        raise ValueError("Not enough chips")
+    state.stacks[p] -= pay
+    state.pot += pay
+    state.round_contrib[p] += pay
+    state.acted[p] = True
+    # If this was a short all-in call, refund the uncalled portion to the bettor
+    # (side-pot is uncontested in heads-up and belongs to the covering player).
+    if pay < tc:
+        o = state._other(p)
+        excess = state.round_contrib[o] - state.round_contrib[p]
+        if excess > 0:
+            state.round_contrib[o] -= excess
+            state.pot -= excess
+            state.stacks[o] += excess
+            state.history.append({"event": "uncalled_return", "player": o, "amount": excess})
+        _runout_to_showdown(state)
+        return
+    # If anyone is all-in after calling, run out to showdown.
+    if state.stacks[0] == 0 or state.stacks[1] == 0:
+        _runout_to_showdown(state)
+        return
+    if _round_closed(state):
+        _advance_street(state)
+    else:
+        state.actor = state._other(p)
+
+
+def _apply_raise_to(state: HandState, p: int, action: Dict[str, Any]) -> None:
+    total = int(action["total"])
+    old_max = state.max_bet()
+    need_total = total - state.round_contrib[p]
+    if need_total > state.stacks[p] or total < state.round_contrib[p]:
+        raise ValueError("Invalid raise")
+    if total < old_max + state.last_raise_increment:
+        raise ValueError("Raise too small")
+    state.stacks[p] -= need_total
+    state.pot += need_total
+    state.round_contrib[p] = total
+    new_max = state.max_bet()
+    state.last_raise_increment = max(new_max - old_max, state.bb_chips)
+    state.acted[p] = True
+    state.acted[state._other(p)] = False
+    state.actor = state._other(p)
+    # If the raiser is now all-in, the responder will still act (fold/call),
+    # but if both end up all-in after response, the call branch will runout.
+
+
+_ACTION_HANDLERS: Dict[str, Callable[[HandState, int, Dict[str, Any]], None]] = {
+    "fold": _apply_fold,
+    "check": _apply_check,
+    "call": _apply_call,
+    "raise_to": _apply_raise_to,
+}
+
+
 def apply_action(
     state: HandState,
     action: Dict[str, Any],
@@ -284,79 +364,10 @@ def apply_action(
         entry["llm"] = decision_meta
     state.history.append(entry)
 
-    if kind == "fold":
-        w = state._other(p)
-        state.winner = w
-        state.stacks[w] += state.pot
-        state.pot = 0
-        state.phase = "hand_over"
-        return
-
-    if kind == "check":
-        if state.to_call(p) != 0:
-            raise ValueError("Cannot check with amount to call")
-        state.acted[p] = True
-        if _round_closed(state):
-            _advance_street(state)
-        else:
-            state.actor = state._other(p)
-        return
-
-    if kind == "call":
-        tc = state.to_call(p)
-        if tc <= 0:
-            raise ValueError("Nothing to call")
-        # Allow all-in calls for less than full to-call.
-        pay = min(tc, state.stacks[p])
-        if pay <= 0:
-            raise ValueError("Not enough chips")
-        state.stacks[p] -= pay
-        state.pot += pay
-        state.round_contrib[p] += pay
-        state.acted[p] = True
-        # If this was a short all-in call, refund the uncalled portion to the bettor
-        # (side-pot is uncontested in heads-up and belongs to the covering player).
-        if pay < tc:
-            o = state._other(p)
-            excess = state.round_contrib[o] - state.round_contrib[p]
-            if excess > 0:
-                state.round_contrib[o] -= excess
-                state.pot -= excess
-                state.stacks[o] += excess
-                state.history.append({"event": "uncalled_return", "player": o, "amount": excess})
-            _runout_to_showdown(state)
-            return
-        # If anyone is all-in after calling, run out to showdown.
-        if state.stacks[0] == 0 or state.stacks[1] == 0:
-            _runout_to_showdown(state)
-            return
-        if _round_closed(state):
-            _advance_street(state)
-        else:
-            state.actor = state._other(p)
-        return
-
-    if kind == "raise_to":
-        total = int(action["total"])
-        old_max = state.max_bet()
-        need_total = total - state.round_contrib[p]
-        if need_total > state.stacks[p] or total < state.round_contrib[p]:
-            raise ValueError("Invalid raise")
-        if total < old_max + state.last_raise_increment:
-            raise ValueError("Raise too small")
-        state.stacks[p] -= need_total
-        state.pot += need_total
-        state.round_contrib[p] = total
-        new_max = state.max_bet()
-        state.last_raise_increment = max(new_max - old_max, state.bb_chips)
-        state.acted[p] = True
-        state.acted[state._other(p)] = False
-        state.actor = state._other(p)
-        # If the raiser is now all-in, the responder will still act (fold/call),
-        # but if both end up all-in after response, the call branch will runout.
-        return
-
-    raise ValueError(f"Unknown action {kind}")
+    handler = _ACTION_HANDLERS.get(kind)
+    if handler is None:
+        raise ValueError(f"Unknown action {kind}")
+    handler(state, p, action)
 
 
 def _go_showdown(state: HandState) -> None:
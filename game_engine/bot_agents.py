@@ -7,6 +7,7 @@ from __future__ import annotations
 
 import importlib.util
 import random
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Optional, Tuple
 
@@ -26,7 +27,8 @@ def normalize_agent(name: Optional[str]) -> str:
     return a if a in _BOT_AGENTS else DEFAULT_BOT_AGENT
 
 
-def _load_module1_decider():
+@lru_cache(maxsize=None)
+def _load_module1():
     path = ROOT / "Module 1" / "propositional_logic.py"
     if not path.exists():
         return None
@@ -35,7 +37,11 @@ def _load_module1_decider():
         return None
     mod = importlib.util.module_from_spec(spec)
     spec.loader.exec_module(mod)
-    return getattr(mod, "propositional_logic_hand_decider", None)
+    return mod
+
+
+def _load_module1_decider():
+    return getattr(_load_module1(), "is_hand_playable", None)
 
 
 def _load_a_star():
@@ -53,8 +59,12 @@ _a_star_search = None
 _m4_dir = ROOT / "Module 4"
 
 
+@lru_cache(maxsize=None)
 def _load_module4_choose_with_meta():
-    """Import Module 4 ``choose_preflop_action_with_meta`` (folder name has a space)."""
+    """Import Module 4 ``choose_preflop_action_with_meta`` (folder name has a space).
+
+    Resolved once per process; later bot turns reuse the cached function.
+    """
     if not _m4_dir.is_dir():
         return None
     project_paths.ensure_paths((_m4_dir,))
@@ -115,14 +125,13 @@ def _m12_action(state: HandState, rng: random.Random) -> Dict[str, Any]:
 
     if _m1_decider is not None:
         try:
-            dec = _m1_decider(
+            playable = _m1_decider(
                 hand,
                 pos,
                 max(1, int(state.stacks[p] // bb)),
                 "Unknown",
-                opp_bet_bb,
             )
-            if not dec.get("playable"):
+            if not playable:
                 fold = first_legal_kind(legal, "fold")
                 if fold is not None:
                     return fold
@@ -156,6 +165,25 @@ def _m12_action(state: HandState, rng: random.Random) -> Dict[str, Any]:
     return random_legal_action(state, rng)
 
 
+def warm_up() -> None:
+    """Resolve the lazy Module 1/2/4 imports and fill the playability memo.
+
+    Call once at server start so the first bot turn does not pay the cold path.
+    """
+    global _m1_decider, _a_star_search
+    if _m1_decider is None:
+        _m1_decider = _load_module1_decider()
+    if _a_star_search is None:
+        _a_star_search = _load_a_star()
+    _load_module4_choose_with_meta()
+    m1 = _load_module1()
+    if m1 is not None and hasattr(m1, "precompute_playability"):
+        m1.precompute_playability()
+    if _a_star_search is not None:
+        # Loads Module 2's equity table.
+        _a_star_search("AA", "Button", (50.0, 50.0), "Unknown", None)
+
+
 def pick_bot_action(
     agent: Optional[str], state: HandState, rng: random.Random
 ) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
@@ -38,8 +38,12 @@ class Card:
         return f"{rank_names[self.rank]}{suit_symbols[SUITS[self.suit]]}"
 
 
+# Cards are immutable, so one ordered deck is built at import and copied per hand.
+FULL_DECK: Tuple[Card, ...] = tuple(Card(r, s) for r in range(13) for s in range(4))
+
+
 def new_deck(rng: Optional[random.Random] = None) -> List[Card]:
-    deck = [Card(r, s) for r in range(13) for s in range(4)]
+    deck = list(FULL_DECK)
     r = rng or random.Random()
     r.shuffle(deck)
     return deck
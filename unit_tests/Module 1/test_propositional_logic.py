@@ -11,21 +11,26 @@ Tests cover:
 """
 
 import unittest
-from pathlib import Path
 
 import project_paths
 
 # Add parent directory to path to import module
-project_paths.ensure_paths((Path(__file__).parent.parent.parent / "Module 1",))
+project_paths.ensure_paths((project_paths.PROJECT_ROOT / "Module 1",))
 
 from propositional_logic import (
     propositional_logic_hand_decider,
+    is_hand_playable,
+    precompute_playability,
+    encode_hand,
+    HAND_IDS,
+    ID_TO_HAND,
     KnowledgeBase,
     CNFRule,
     _create_cnf_rules,
     _derive_facts_from_input,
     _rank_to_tier,
     _normalize_hand,
+    _normalize_hand_slow,
     _get_hand_rank,
     HAND_STRENGTH_PREMIUM_MAX,
     HAND_STRENGTH_STRONG_MAX,
@@ -173,10 +178,33 @@ class TestCNFRules(unittest.TestCase):
         self.assertIn("Final Decision", rule10.name)
         self.assertIn("final_playable", rule10.cnf)
 
+    def test_decider_rules_match_fresh_serialization(self):
+        """The precomputed rule output matches serializing freshly built rules."""
+        kb = KnowledgeBase()
+        for rule in _create_cnf_rules():
+            kb.add_rule(rule)
+        result = propositional_logic_hand_decider("AA", "Button", 50, "Tight")
+        self.assertEqual(result["knowledge_base"]["rules"], kb.to_dict()["rules"])
+
+    def test_decider_rule_dicts_are_not_shared(self):
+        """Mutating one result's rules does not leak into later results."""
+        first = propositional_logic_hand_decider("AA", "Button", 50, "Tight")
+        original = first["knowledge_base"]["rules"][0]["description"]
+        first["knowledge_base"]["rules"][0]["description"] = "MUTATED"
+        second = propositional_logic_hand_decider("72o", "Big Blind", 15, "Loose")
+        self.assertEqual(second["knowledge_base"]["rules"][0]["description"], original)
+
 
 class TestHandRanking(unittest.TestCase):
     """Test hand ranking and tier functions."""
 
+    def test_normalize_table_matches_slow_path(self):
+        """Precomputed spellings normalize exactly like the alias/suffix matcher."""
+        spellings = ["AKs", "aks", "KAo", "ako", "72O", "27o", "99", "tt", "Ace King suited",
+                     "pocket aces", " QQ ", "AK suited", "AKx", "ZZ"]
+        for s in spellings:
+            self.assertEqual(_normalize_hand(s), _normalize_hand_slow(s), s)
+
     def test_rank_to_tier_premium(self):
         """Test premium tier classification."""
         self.assertEqual(_rank_to_tier(1), "Premium")
@@ -461,6 +489,37 @@ class TestMainFunction(unittest.TestCase):
         self.assertIn("backward chaining", chain_str.lower() or "rule" in chain_str.lower())
 
 
+class TestPlayabilityMemo(unittest.TestCase):
+    """Test the memoized playability shortcut against the full decider."""
+
+    def test_matches_full_decider(self):
+        """Boolean verdicts agree across hands, positions, stacks, and tendencies."""
+        for hand in ("AA", "AKs", "Ace King suited", "89s", "72o", "XYZ"):
+            for position in ("Button", "Big Blind", "Middle"):
+                for stack in (5, 9, 10, 19, 20, 100):
+                    for tendency in ("Tight", "loose", "Unknown"):
+                        expected = propositional_logic_hand_decider(
+                            hand, position, stack, tendency
+                        )["playable"]
+                        self.assertEqual(
+                            is_hand_playable(hand, position, stack, tendency),
+                            expected,
+                            (hand, position, stack, tendency),
+                        )
+
+    def test_precompute_covers_all_combinations(self):
+        """Precompute fills at least 169 hands x 2 positions x 3 buckets x 5 tendencies."""
+        self.assertGreaterEqual(precompute_playability(), 169 * 2 * 3 * 5)
+
+    def test_hand_ids_are_unique_16_bit(self):
+        """Every canonical hand gets its own 16-bit id that maps back to it."""
+        self.assertEqual(len(ID_TO_HAND), 169)
+        for hand, hand_id in HAND_IDS.items():
+            self.assertLess(hand_id, 1 << 16)
+            self.assertEqual(ID_TO_HAND[hand_id], hand)
+        self.assertNotEqual(encode_hand("KAs"), encode_hand("KAo"))
+
+
 class TestBackwardChaining(unittest.TestCase):
     """Test backward chaining inference."""
 
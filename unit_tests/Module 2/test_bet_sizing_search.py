@@ -9,25 +9,29 @@ Tests cover:
 """
 
 import unittest
-from pathlib import Path
 
 import project_paths
 
 # Add Module 2 to path
-project_paths.ensure_paths((Path(__file__).parent.parent.parent / "Module 2",))
+project_paths.ensure_paths((project_paths.PROJECT_ROOT / "Module 2",))
 
 from ev_calculator import (
     calculate_ev,
+    calculate_ev_batch,
     calculate_ev_call,
     calculate_ev_fold,
     _get_bet_size_category,
+    _bet_size_category_index,
     _get_adjusted_opponent_probs,
+    CAT_SMALL,
+    CAT_MEDIUM,
+    CAT_LARGE,
     get_hand_equity,
     OPPONENT_PROBABILITIES,
     BET_SIZE_SMALL_MAX,
     BET_SIZE_MEDIUM_MAX,
 )
-from bet_sizing_search import a_star_search
+from bet_sizing_search import a_star_search, clear_cache
 from bet_size_discretization import (
     MIN_BET_SIZE,
     MAX_STANDARD_BET_SIZE,
@@ -53,6 +57,13 @@ class TestBetSizeCategories(unittest.TestCase):
         self.assertEqual(_get_bet_size_category(5.0), "large")
         self.assertEqual(_get_bet_size_category(10.0), "large")
 
+    def test_integer_categories_match_names(self):
+        """Integer categories line up with the string categories at the boundaries."""
+        self.assertEqual(_bet_size_category_index(2.5), CAT_SMALL)
+        self.assertEqual(_bet_size_category_index(2.6), CAT_MEDIUM)
+        self.assertEqual(_bet_size_category_index(4.0), CAT_MEDIUM)
+        self.assertEqual(_bet_size_category_index(4.1), CAT_LARGE)
+
 
 class TestAdjustedProbabilities(unittest.TestCase):
     """Test that opponent probabilities adjust by bet size category."""
@@ -67,11 +78,13 @@ class TestAdjustedProbabilities(unittest.TestCase):
 
     def test_probabilities_sum_to_one(self):
         """Adjusted probabilities should sum to 1."""
-        for tendency in ["Tight", "Loose", "Aggressive"]:
-            for bet_size in [2.0, 3.0, 6.0]:
-                probs = _get_adjusted_opponent_probs(tendency, bet_size)
-                total = probs["fold"] + probs["call"] + probs["raise"]
-                self.assertAlmostEqual(total, 1.0, places=5)
+        totals = {
+            (tendency, bet_size): sum(_get_adjusted_opponent_probs(tendency, bet_size).values())
+            for tendency in OPPONENT_PROBABILITIES
+            for bet_size in [2.0, 3.0, 6.0]
+        }
+        off = {key: total for key, total in totals.items() if abs(total - 1.0) > 1e-5}
+        self.assertEqual(off, {})
 
     def test_small_medium_large_patterns_all_tendencies(self):
         """
@@ -147,6 +160,20 @@ class TestExpectedValue(unittest.TestCase):
         )
         self.assertIsInstance(ev, float)
 
+    def test_ev_batch_matches_scalar(self):
+        """Batch EV over a grid equals one calculate_ev call per size."""
+        bets = [3.0, 6.0, 9.0, 50.0]
+        actions = ["call", "raise", "raise", "raise"]
+        batch = calculate_ev_batch(
+            bets, actions, "KAs", "Big Blind", (50, 50), "Loose", 4.0, 3.0,
+            street="flop", board_features={"wet": True}, spr=1.5,
+        )
+        for bet, action, ev in zip(bets, actions, batch):
+            self.assertEqual(ev, calculate_ev(
+                bet, "KAs", "Big Blind", (50, 50), "Loose", 4.0, 3.0, action,
+                street="flop", board_features={"wet": True}, spr=1.5,
+            ))
+
 
 class TestAStarSearch(unittest.TestCase):
     """Test A* search algorithm."""
@@ -166,6 +193,26 @@ class TestAStarSearch(unittest.TestCase):
             self.assertLessEqual(result["bet_size"], 50)  # Cannot exceed stack
             self.assertGreater(result["ev"], 0)
 
+    def test_a_star_prunes_once_best_ev_dominates(self):
+        """A* stops before the full grid once no remaining f(n) can beat the best EV."""
+        result = a_star_search("AA", "Button", (50, 50), "Tight")
+        self.assertLess(result["nodes_explored"], len(get_bet_sizes_for_scenario(50, None)))
+
+    def test_a_star_memoized_results_are_independent(self):
+        """Repeated queries hit the memo but return separate dicts."""
+        clear_cache()
+        first = a_star_search("AA", "Button", (50, 50), "Tight")
+        first["action"] = "mutated"
+        second = a_star_search("AA", "Button", (50, 50), "Tight")
+        self.assertNotEqual(second["action"], "mutated")
+        features = {"wet": True, "paired": False}
+        self.assertEqual(
+            a_star_search("AA", "Button", (50, 50), "Tight", pot_size=6.0, street="flop",
+                          board_features=features),
+            a_star_search("AA", "Button", (50, 50), "Tight", pot_size=6.0, street="flop",
+                          board_features=dict(features)),
+        )
+
     def test_a_star_strong_hand(self):
         """A* with strong hand."""
         result = a_star_search(
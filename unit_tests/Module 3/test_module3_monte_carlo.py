@@ -8,18 +8,19 @@ These tests are intentionally lightweight and focus on:
 
 import unittest
 import random
-from pathlib import Path
+import statistics
 
 import project_paths
 
 # Project root (for full_game_engine) and Module 3
-_ROOT = Path(__file__).resolve().parent.parent.parent
+_ROOT = project_paths.PROJECT_ROOT
 project_paths.ensure_paths((_ROOT, _ROOT / "Module 3"))
 
 from full_game_engine.cards import Card
 
 from monte_carlo_simulator import (  # type: ignore
     _get_adjusted_opponent_probs,
+    _mean_std_ci95,
     monte_carlo_equity_vs_conditioned_range,
     run_simulation,
     run_simulation_for_strategy,
@@ -93,6 +94,44 @@ class TestRunSimulation(unittest.TestCase):
         )
         self.assertAlmostEqual(result["value_estimate"], 0.0, places=6)
 
+    def test_run_simulation_fold_skips_trials(self):
+        """Folds short-circuit: no trials run and the CI collapses to a point."""
+        result = run_simulation(
+            hand="72o",
+            action="open",
+            bet_size=0.0,
+            position="Button",
+            stack_sizes=(50, 50),
+            opponent_tendency="Loose",
+            num_trials=500,
+            seed=3,
+        )
+        self.assertEqual(result["num_trials"], 0)
+        self.assertEqual(result["std"], 0.0)
+        self.assertEqual(result["confidence_interval"], (0.0, 0.0))
+
+    def test_run_simulation_quasi_random_matches_pseudorandom(self):
+        """Halton-driven trials are reproducible and agree with the PRNG estimate."""
+        base = dict(
+            hand="KQs",
+            action="open",
+            bet_size=3.0,
+            position="Button",
+            stack_sizes=(50, 50),
+            opponent_tendency="Loose",
+            num_trials=4000,
+            seed=21,
+        )
+        qmc_a = run_simulation(**base, quasi_random=True)
+        qmc_b = run_simulation(**base, quasi_random=True)
+        prng = run_simulation(**base)
+        self.assertEqual(qmc_a["value_estimate"], qmc_b["value_estimate"])
+        lo, hi = prng["confidence_interval"]
+        margin = hi - lo
+        self.assertAlmostEqual(
+            qmc_a["value_estimate"], prng["value_estimate"], delta=margin
+        )
+
     def test_run_simulation_postflop_board_affects_value(self):
         """With hero hole + board, EV uses board-aware equity (not preflop table only)."""
         hole = (Card.from_str("7d"), Card.from_str("2c"))
@@ -166,6 +205,23 @@ class TestRunSimulation(unittest.TestCase):
         self.assertEqual(a, b)
 
 
+class TestSummaryStatistics(unittest.TestCase):
+    """Test the one-pass mean/std/CI helper."""
+
+    def test_mean_std_match_two_pass(self):
+        """Welford results agree with the textbook two-pass formulas."""
+        values = [1.5, -3.0, 4.5, -3.0, 1.5, 6.0, -1.0]
+        mean, std, (lo, hi) = _mean_std_ci95(iter(values))
+        self.assertAlmostEqual(mean, statistics.mean(values), places=9)
+        self.assertAlmostEqual(std, statistics.stdev(values), places=9)
+        self.assertAlmostEqual(hi - mean, mean - lo, places=9)
+
+    def test_empty_and_single_value(self):
+        """Degenerate inputs yield zero spread."""
+        self.assertEqual(_mean_std_ci95([]), (0.0, 0.0, (0.0, 0.0)))
+        self.assertEqual(_mean_std_ci95([2.0]), (2.0, 0.0, (2.0, 2.0)))
+
+
 class TestStrategySimulation(unittest.TestCase):
     """Tests for strategy-level Monte Carlo evaluation and optimization."""
 
@@ -187,6 +243,22 @@ class TestStrategySimulation(unittest.TestCase):
         self.assertIn("AA", result["per_hand_results"])
         self.assertIn("72o", result["per_hand_results"])
 
+    def test_run_simulation_for_strategy_process_pool_matches_serial(self):
+        """Parallel per-hand simulation reproduces the serial result exactly."""
+        strategy = {"AA": 3.0, "KK": 2.5, "72o": 0.0, "T9s": 4.0}
+        kwargs = dict(
+            strategy=strategy,
+            position="Button",
+            stack_sizes=(50, 50),
+            opponent_tendency="Loose",
+            num_trials_per_hand=100,
+            seed=17,
+        )
+        serial = run_simulation_for_strategy(**kwargs)
+        parallel = run_simulation_for_strategy(**kwargs, max_workers=2)
+        self.assertEqual(serial["per_hand_results"], parallel["per_hand_results"])
+        self.assertEqual(serial["expected_value"], parallel["expected_value"])
+
     def test_optimize_opening_actions_basic(self):
         """optimize_opening_actions returns a reasonable strategy object."""
         result = optimize_opening_actions(
@@ -246,6 +318,24 @@ class TestStrategySimulation(unittest.TestCase):
         self.assertIn("per_hand_ev", result)
         self.assertEqual(set(result["per_hand_ev"].keys()), set(strategy.keys()))
 
+    def test_evaluate_strategy_seeded_results_are_memoized(self):
+        """Repeated seeded evaluations match and do not share mutable rows."""
+        strategy = {"AA": 3.0, "72o": 0.0}
+        kwargs = dict(
+            strategy=strategy,
+            position="Button",
+            stack_sizes=(50, 50),
+            opponent_tendency="Tight",
+            num_trials=80,
+            seed=11,
+        )
+        first = evaluate_strategy(**kwargs)
+        first["per_hand_results"]["AA"]["value_estimate"] = 999.0
+        second = evaluate_strategy(**kwargs)
+        fresh = evaluate_strategy(**kwargs, force_recompute=True)
+        self.assertEqual(second["per_hand_ev"], fresh["per_hand_ev"])
+        self.assertEqual(second["expected_value"], fresh["expected_value"])
+
     def test_get_opening_strategy_for_module4_smoke(self):
         """Module 4 helper returns same structure as optimize_opening_actions."""
         result = get_opening_strategy_for_module4(
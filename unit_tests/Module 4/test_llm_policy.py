@@ -4,11 +4,10 @@ from __future__ import annotations
 
 import random
 import unittest
-from pathlib import Path
 
 import project_paths
 
-ROOT = Path(__file__).resolve().parent.parent.parent
+ROOT = project_paths.PROJECT_ROOT
 _M4 = ROOT / "Module 4"
 project_paths.ensure_paths((ROOT, _M4))
 
@@ -8,7 +8,7 @@ from pathlib import Path
 
 import project_paths
 
-ROOT = Path(__file__).resolve().parent.parent.parent
+ROOT = project_paths.PROJECT_ROOT
 M5 = ROOT / "Module 5"
 project_paths.ensure_paths((ROOT, M5))
 
@@ -2,14 +2,13 @@
 
 import random
 import unittest
-from pathlib import Path
 
 import project_paths
 
-ROOT = Path(__file__).resolve().parent.parent.parent
+ROOT = project_paths.PROJECT_ROOT
 project_paths.ensure_paths((ROOT,))
 
-from full_game_engine.bot_agents import normalize_agent, pick_bot_action
+from full_game_engine.bot_agents import normalize_agent, pick_bot_action, warm_up
 from full_game_engine.hu_hand import apply_action, legal_actions, new_hand
 
 
@@ -38,6 +37,13 @@ class TestModule2BotActions(unittest.TestCase):
         act, _meta = pick_bot_action("m2", h, rng)
         self.assertIn(act, legal_actions(h))
 
+    def test_m2_acts_after_warm_up(self):
+        warm_up()
+        rng = random.Random(4)
+        h = new_hand([400, 400], rng=rng, button=0, sb_chips=10, bb_chips=20)
+        act, _meta = pick_bot_action("m2", h, rng)
+        self.assertIn(act, legal_actions(h))
+
 
 class TestModule3BotActions(unittest.TestCase):
     def test_m3_returns_legal_action_preflop(self):
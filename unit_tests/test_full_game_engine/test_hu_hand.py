@@ -2,11 +2,10 @@
 
 import random
 import unittest
-from pathlib import Path
 
 import project_paths
 
-ROOT = Path(__file__).resolve().parent.parent.parent
+ROOT = project_paths.PROJECT_ROOT
 project_paths.ensure_paths((ROOT,))
 
 from full_game_engine.hu_hand import apply_action, legal_actions, new_hand
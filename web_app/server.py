@@ -15,8 +15,9 @@ import os
 import secrets
 import random
 import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 import project_paths
 
@@ -25,7 +26,7 @@ ROOT = project_paths.PROJECT_ROOT
 
 from flask import Flask, jsonify, render_template, request
 
-from game_engine.bot_agents import DEFAULT_BOT_AGENT, normalize_agent, pick_bot_action
+from game_engine.bot_agents import DEFAULT_BOT_AGENT, normalize_agent, pick_bot_action, warm_up
 from game_engine.hu_preflop import (
     HandState,
     apply_action,
@@ -41,16 +42,49 @@ app = Flask(
 )
 app.secret_key = os.environ.get("FLASK_SECRET", "dev-preflop-showdown-key")
 
-SESSIONS: Dict[str, Dict[str, Any]] = {}
+
+def _use_orjson_if_available() -> None:
+    """Encode API responses with ``orjson`` (C extension) when it is installed.
+
+    Keys stay sorted and debug responses stay indented, as with Flask's default
+    provider; non-ASCII text is sent as UTF-8 rather than ``\\u`` escapes.
+    """
+    try:
+        import orjson
+    except ImportError:
+        return
+    from flask.json.provider import DefaultJSONProvider
+
+    class OrjsonProvider(DefaultJSONProvider):
+        def dumps(self, obj: Any, **kwargs: Any) -> str:
+            option = orjson.OPT_NON_STR_KEYS
+            if kwargs.get("sort_keys", self.sort_keys):
+                option |= orjson.OPT_SORT_KEYS
+            if kwargs.get("indent"):
+                option |= orjson.OPT_INDENT_2
+            return orjson.dumps(obj, default=self.default, option=option).decode()
+
+        def loads(self, s: Any, **kwargs: Any) -> Any:
+            return orjson.loads(s)
+
+    app.json = OrjsonProvider(app)
+
+
+_use_orjson_if_available()
+
+# Least-recently-used first; capped so abandoned sessions do not grow memory forever.
+SESSIONS: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
 SESSION_BOT_LOCKS: Dict[str, threading.Lock] = {}
+MAX_SESSIONS = 10_000
+_SESSIONS_LOCK = threading.Lock()
 STARTING_STACK = 2000
 BB = 20
 
 
 def _bot_lock(sid: str) -> threading.Lock:
-    if sid not in SESSION_BOT_LOCKS:
-        SESSION_BOT_LOCKS[sid] = threading.Lock()
-    return SESSION_BOT_LOCKS[sid]
+    # setdefault is atomic, so concurrent requests for one session share a lock;
+    # the get() first avoids allocating a lock on every call.
+    return SESSION_BOT_LOCKS.get(sid) or SESSION_BOT_LOCKS.setdefault(sid, threading.Lock())
 
 
 def _session_id() -> str:
@@ -60,20 +94,40 @@ def _session_id() -> str:
     return secrets.token_hex(16)
 
 
-def _ensure_session() -> str:
+def _ensure_session() -> Tuple[str, Dict[str, Any]]:
+    """Return ``(sid, session)``; use this session dict, as ``sid`` may be evicted later."""
     sid = _session_id()
-    if sid not in SESSIONS:
-        SESSIONS[sid] = {
+    with _SESSIONS_LOCK:
+        s = SESSIONS.get(sid)
+        if s is not None:
+            SESSIONS.move_to_end(sid)
+            return sid, s
+        s = SESSIONS[sid] = {
             "stacks": [STARTING_STACK, STARTING_STACK],
             "button": 0,
             "rng": random.Random(),
             "bot_agent": DEFAULT_BOT_AGENT,
         }
-    return sid
+        _evict_oldest_sessions()
+    return sid, s
+
+
+def _evict_oldest_sessions() -> None:
+    """Drop least-recently-used sessions past MAX_SESSIONS; caller holds _SESSIONS_LOCK."""
+    skipped = 0
+    while len(SESSIONS) > MAX_SESSIONS and skipped < len(SESSIONS):
+        oldest = next(iter(SESSIONS))
+        lock = SESSION_BOT_LOCKS.get(oldest)
+        if lock is not None and lock.locked():
+            # Bot is mid-turn for this session: count it as just used.
+            SESSIONS.move_to_end(oldest)
+            skipped += 1
+            continue
+        del SESSIONS[oldest]
+        SESSION_BOT_LOCKS.pop(oldest, None)
 
 
-def _bot_agent_for_session(sid: str) -> str:
-    s = SESSIONS.get(sid)
+def _bot_agent_for_session(s: Optional[Dict[str, Any]]) -> str:
     if not s:
         return DEFAULT_BOT_AGENT
     if "bot_agent" not in s:
@@ -81,8 +135,21 @@ def _bot_agent_for_session(sid: str) -> str:
     return normalize_agent(s.get("bot_agent"))
 
 
-def state_to_json(state: HandState, human_seat: int = 0) -> Dict[str, Any]:
-    """Serialize hand; hide opponent hole cards until hand is over."""
+def _debug_requested() -> bool:
+    """True when the client asked for bot decision metadata (``?debug=1``)."""
+    return request.args.get("debug") == "1"
+
+
+def _without_decision_meta(entries: list) -> list:
+    return [{k: v for k, v in e.items() if k != "llm"} if "llm" in e else e for e in entries]
+
+
+def state_to_json(state: HandState, human_seat: int = 0, debug: bool = False) -> Dict[str, Any]:
+    """Serialize hand; hide opponent hole cards until hand is over.
+
+    Bot decision metadata (``llm`` on history entries) is only sent with the full
+    history at hand end, where the UI shows it, or always when ``debug`` is set.
+    """
     show_all = state.phase == "hand_over"
     h0 = [str(c) for c in state.hole_cards[0]]
     h1 = [str(c) for c in state.hole_cards[1]]
@@ -104,7 +171,7 @@ def state_to_json(state: HandState, human_seat: int = 0) -> Dict[str, Any]:
         "winner": state.winner,
         "button": state.button,
         "bb_chips": state.bb_chips,
-        "history_tail": state.history[-6:],
+        "history_tail": state.history[-6:] if debug else _without_decision_meta(state.history[-6:]),
     }
     if state.phase == "hand_over":
         out["history_full"] = state.history
@@ -116,12 +183,17 @@ def state_to_json(state: HandState, human_seat: int = 0) -> Dict[str, Any]:
     return out
 
 
-def run_bot_until_human(state: HandState, rng: random.Random, sid: Optional[str] = None) -> None:
+def run_bot_until_human(
+    state: HandState,
+    rng: random.Random,
+    sid: Optional[str] = None,
+    session: Optional[Dict[str, Any]] = None,
+) -> None:
     """Run bot action(s) until it's human's turn or hand is over. No artificial delay."""
     lock = _bot_lock(sid) if sid else None
 
     def _run() -> None:
-        ag = _bot_agent_for_session(sid) if sid else DEFAULT_BOT_AGENT
+        ag = _bot_agent_for_session(session)
         while state.phase == "preflop" and state.actor == 1:
             act, bot_meta = pick_bot_action(ag, state, rng)
             apply_action(state, act, decision_meta=bot_meta)
@@ -135,7 +207,7 @@ def run_bot_until_human(state: HandState, rng: random.Random, sid: Optional[str]
 
 @app.route("/")
 def index():
-    sid = _ensure_session()
+    sid, _ = _ensure_session()
     resp = app.make_response(render_template("index.html", starting_stack=STARTING_STACK))
     resp.set_cookie("sid", sid, httponly=True, samesite="Lax")
     return resp
@@ -144,26 +216,24 @@ def index():
 @app.route("/api/state", methods=["GET"])
 def api_state():
     """Current state only — does not advance the bot."""
-    sid = _ensure_session()
-    s = SESSIONS.get(sid)
-    if not s or "hand" not in s:
+    sid, s = _ensure_session()
+    if "hand" not in s:
         return jsonify(
             {
                 "needs_new_hand": True,
-                "stacks": s.get("stacks", [STARTING_STACK, STARTING_STACK]) if s else [STARTING_STACK, STARTING_STACK],
-                "bot_agent": _bot_agent_for_session(sid),
+                "stacks": s.get("stacks", [STARTING_STACK, STARTING_STACK]),
+                "bot_agent": _bot_agent_for_session(s),
             }
         )
     state: HandState = s["hand"]
-    resp = jsonify({"state": state_to_json(state, human_seat=0), "bot_agent": _bot_agent_for_session(sid)})
+    resp = jsonify({"state": state_to_json(state, human_seat=0, debug=_debug_requested()), "bot_agent": _bot_agent_for_session(s)})
     resp.set_cookie("sid", sid, httponly=True, samesite="Lax")
     return resp
 
 
 @app.route("/api/new_hand", methods=["POST"])
 def api_new_hand():
-    sid = _ensure_session()
-    s = SESSIONS[sid]
+    sid, s = _ensure_session()
     data = request.get_json(silent=True) or {}
     stacks = data.get("stacks")
     if stacks and len(stacks) == 2:
@@ -172,7 +242,7 @@ def api_new_hand():
     state = new_hand(s["stacks"], rng=s["rng"], button=btn)
     s["hand"] = state
     s["button"] = 1 - btn
-    resp = jsonify({"state": state_to_json(state, human_seat=0), "bot_agent": _bot_agent_for_session(sid)})
+    resp = jsonify({"state": state_to_json(state, human_seat=0, debug=_debug_requested()), "bot_agent": _bot_agent_for_session(s)})
     resp.set_cookie("sid", sid, httponly=True, samesite="Lax")
     return resp
 
@@ -180,11 +250,11 @@ def api_new_hand():
 @app.route("/api/set_agent", methods=["POST"])
 def api_set_agent():
     """Set opponent agent for this session: random | m12 | m3 | m4."""
-    sid = _ensure_session()
+    sid, s = _ensure_session()
     body = request.get_json(silent=True) or {}
     raw = body.get("agent", DEFAULT_BOT_AGENT)
     ag = normalize_agent(str(raw) if raw is not None else DEFAULT_BOT_AGENT)
-    SESSIONS[sid]["bot_agent"] = ag
+    s["bot_agent"] = ag
     resp = jsonify({"ok": True, "bot_agent": ag})
     resp.set_cookie("sid", sid, httponly=True, samesite="Lax")
     return resp
@@ -211,10 +281,9 @@ def _match_legal(body: Dict[str, Any], legal: list, state: HandState) -> Optiona
 @app.route("/api/action", methods=["POST"])
 def api_action():
     """Apply human action only; returns immediately (bot moves later via /api/advance_bot)."""
-    sid = _ensure_session()
-    if sid not in SESSIONS or "hand" not in SESSIONS[sid]:
+    sid, s = _ensure_session()
+    if "hand" not in s:
         return jsonify({"error": "No hand"}), 400
-    s = SESSIONS[sid]
     state: HandState = s["hand"]
     if state.phase != "preflop" or state.actor != 0:
         return jsonify({"error": "Not your turn or hand over"}), 400
@@ -227,7 +296,7 @@ def api_action():
     apply_action(state, action)
     if state.phase == "hand_over":
         s["stacks"] = list(state.stacks)
-    resp = jsonify({"state": state_to_json(state, human_seat=0), "bot_agent": _bot_agent_for_session(sid)})
+    resp = jsonify({"state": state_to_json(state, human_seat=0, debug=_debug_requested()), "bot_agent": _bot_agent_for_session(s)})
     resp.set_cookie("sid", sid, httponly=True, samesite="Lax")
     return resp
 
@@ -235,31 +304,30 @@ def api_action():
 @app.route("/api/advance_bot", methods=["POST"])
 def api_advance_bot():
     """Run the bot after the client has waited (thinking delay). Idempotent if not bot's turn."""
-    sid = _ensure_session()
-    if sid not in SESSIONS or "hand" not in SESSIONS[sid]:
+    sid, s = _ensure_session()
+    if "hand" not in s:
         return jsonify({"error": "No hand"}), 400
-    s = SESSIONS[sid]
     state: HandState = s["hand"]
     if state.phase == "preflop" and state.actor == 1:
-        run_bot_until_human(state, s["rng"], sid=sid)
+        run_bot_until_human(state, s["rng"], sid=sid, session=s)
     if state.phase == "hand_over":
         s["stacks"] = list(state.stacks)
-    resp = jsonify({"state": state_to_json(state, human_seat=0), "bot_agent": _bot_agent_for_session(sid)})
+    resp = jsonify({"state": state_to_json(state, human_seat=0, debug=_debug_requested()), "bot_agent": _bot_agent_for_session(s)})
     resp.set_cookie("sid", sid, httponly=True, samesite="Lax")
     return resp
 
 
 @app.route("/api/legal", methods=["GET"])
 def api_legal():
-    sid = _ensure_session()
-    s = SESSIONS.get(sid)
-    if not s or "hand" not in s:
+    _, s = _ensure_session()
+    if "hand" not in s:
         return jsonify({"actions": []}), 200
     state: HandState = s["hand"]
     return jsonify({"actions": legal_actions(state) if state.phase == "preflop" else []})
 
 
 def main():
+    warm_up()
     app.run(host="127.0.0.1", port=int(os.environ.get("PORT", 5000)), debug=True)
 
 